@@ -0,0 +1,313 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+
+from google.cloud.logging import Client, Logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOG_QUEUE_MAXSIZE = 10000
+BATCH_MAX_ENTRIES = 1000
+BATCH_MAX_BYTES = 5 * 1024 * 1024
+ENTRY_MAX_BYTES = 112640
+FLUSH_INTERVAL_SECONDS = 1.0
+# how long flush() waits for queued entries before giving up, so an unreachable API cannot hang shutdown
+FLUSH_TIMEOUT_SECONDS = 5.0
+STRUCTURED_LABELS_KEY = 'logging.googleapis.com/labels'
+DEDUP_WINDOW_SECONDS = 5.0
+DEDUP_MAX_ENTRIES = 1024
+STDERR_BUFFER_BYTES = 65536
+STDERR_FLUSH_INTERVAL_SECONDS = 0.2
+# entries at these severities are written out immediately
+STDERR_FLUSH_SEVERITIES = frozenset(['WARNING', 'ERROR', 'CRITICAL', 'ALERT', 'EMERGENCY'])
+
+# opt-in for platforms that ship JSON lines written to stderr to Cloud Logging (Cloud Run, App Engine,
+# GKE with its logging agent enabled), so entries skip the entries.write API there
+LOG_TO_STDERR = os.getenv('LOG_TO_STDERR', '').lower() in ('1', 'true', 'yes')
+
+# reports failures of the logging pipeline itself on stderr, apart from application output
+logger = logging.getLogger(__name__)
+
+# shared by every BackgroundLogger, drained by a single worker thread per process
+log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+_worker = None
+_worker_lock = threading.Lock()
+
+# structured entries are buffered and written to stderr in bulk instead of one write per entry
+_stderr_buffer = bytearray()
+_stderr_lock = threading.Lock()
+_stderr_flusher = None
+
+# every BackgroundLogger, so a forked child can replace their dedup locks
+_background_loggers = weakref.WeakSet()
+
+# loggers holding suppressed repeats, whose summaries are written by a sweeper thread once their window closes
+_repeating_loggers = weakref.WeakSet()
+_repeat_sweeper = None
+_repeat_sweeper_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_logging_client() -> Client:
+    # one client per process, so credentials are discovered and the channel is set up only once
+    return Client()
+
+
+def _entry_size(entry) -> int:
+    payload = entry[2]
+    return len(payload) if isinstance(payload, str) else len(str(payload))
+
+
+def _write(entries):
+    # one entries.write RPC per logger instead of one per entry
+    batches = {}
+    for cloud_logger, method, payload, kwargs in entries:
+        batch = batches.get(id(cloud_logger))
+        if batch is None:
+            batch = batches[id(cloud_logger)] = cloud_logger.batch()
+        getattr(batch, method)(payload, **kwargs)
+    for batch in batches.values():
+        try:
+            batch.commit()
+        except Exception:
+            logger.exception("Unable to write %d log entries to %s", len(batch.entries), batch.logger.name)
+
+
+def _drain():
+    while True:
+        entries = [log_queue.get()]
+        size = _entry_size(entries[0])
+        deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+        while len(entries) < BATCH_MAX_ENTRIES and size < BATCH_MAX_BYTES:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                entry = log_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            entries.append(entry)
+            size += _entry_size(entry)
+        try:
+            _write(entries)
+        except Exception:
+            logger.exception("Unable to write %d log entries", len(entries))
+        finally:
+            for _ in entries:
+                log_queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_drain, name='cloud-logging', daemon=True)
+            _worker.start()
+
+
+def _reset_after_fork():
+    # the parent's worker thread and queue locks do not survive fork
+    global log_queue, _worker, _worker_lock, _stderr_buffer, _stderr_lock, _stderr_flusher
+    global _repeating_loggers, _repeat_sweeper, _repeat_sweeper_lock
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    _worker = None
+    _worker_lock = threading.Lock()
+    _stderr_buffer = bytearray()
+    _stderr_lock = threading.Lock()
+    _stderr_flusher = None
+    # the parent writes its own pending repeat summaries, the child must not count them again
+    _repeating_loggers = weakref.WeakSet()
+    _repeat_sweeper = None
+    _repeat_sweeper_lock = threading.Lock()
+    for background_logger in list(_background_loggers):
+        background_logger._recent = OrderedDict()
+        background_logger._recent_lock = threading.Lock()
+    get_logging_client.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _format_structured(log_name: str, payload, severity: str, labels: dict = None) -> bytes:
+    entry = dict(payload) if isinstance(payload, dict) else {'message': payload}
+    entry['severity'] = severity
+    entry[STRUCTURED_LABELS_KEY] = {**labels, 'log_name': log_name} if labels else {'log_name': log_name}
+    return orjson.dumps(entry, default=str) if orjson else json.dumps(entry, default=str).encode()
+
+
+def _flush_stderr_locked():
+    data = bytes(_stderr_buffer)
+    _stderr_buffer.clear()
+    while data:
+        data = data[os.write(2, data):]
+
+
+def _flush_stderr():
+    with _stderr_lock:
+        if _stderr_buffer:
+            _flush_stderr_locked()
+
+
+def _flush_stderr_periodically():
+    while True:
+        time.sleep(STDERR_FLUSH_INTERVAL_SECONDS)
+        try:
+            _flush_stderr()
+        except OSError:
+            pass
+
+
+def _ensure_stderr_flusher():
+    global _stderr_flusher
+    with _stderr_lock:
+        if _stderr_flusher is None:
+            _stderr_flusher = threading.Thread(target=_flush_stderr_periodically, name='stderr-logging', daemon=True)
+            _stderr_flusher.start()
+
+
+def _write_stderr(entry: bytes, severity: str) -> None:
+    if _stderr_flusher is None:
+        _ensure_stderr_flusher()
+    with _stderr_lock:
+        _stderr_buffer.extend(entry)
+        _stderr_buffer.extend(b'\n')
+        if len(_stderr_buffer) >= STDERR_BUFFER_BYTES or severity in STDERR_FLUSH_SEVERITIES:
+            _flush_stderr_locked()
+
+
+def _sweep_repeats(force: bool = False):
+    for background_logger in list(_repeating_loggers):
+        background_logger.flush_repeats(force=force)
+
+
+def _sweep_repeats_periodically():
+    while True:
+        time.sleep(DEDUP_WINDOW_SECONDS)
+        try:
+            _sweep_repeats()
+        except Exception:
+            logger.exception("Unable to write repeated log entry summaries")
+
+
+def _ensure_repeat_sweeper():
+    global _repeat_sweeper
+    with _repeat_sweeper_lock:
+        if _repeat_sweeper is None:
+            _repeat_sweeper = threading.Thread(target=_sweep_repeats_periodically, name='log-repeats', daemon=True)
+            _repeat_sweeper.start()
+
+
+def flush(timeout: float = FLUSH_TIMEOUT_SECONDS):
+    # summaries of still open windows are written too, so no suppressed count is lost at exit
+    _sweep_repeats(force=True)
+    pending = log_queue
+    with pending.all_tasks_done:
+        if not pending.all_tasks_done.wait_for(lambda: not pending.unfinished_tasks, timeout=timeout):
+            logger.error("Gave up on %d log entries not written within %.1fs", pending.unfinished_tasks, timeout)
+    _flush_stderr()
+
+
+atexit.register(flush)
+
+
+class BackgroundLogger:
+    __slots__ = ('logger', 'log_name', '_recent', '_recent_lock', '__weakref__')
+
+    def __init__(self, logger: Logger) -> None:
+        self.logger = logger
+        self.log_name = logger.name
+        # (method, severity, labels, message) -> [window start, suppressed count, method, payload, kwargs]
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        _background_loggers.add(self)
+
+    def log_text(self, text: str, **kwargs) -> None:
+        if len(text) > ENTRY_MAX_BYTES:
+            text = f"{text[:ENTRY_MAX_BYTES]}***Truncated***"
+        if not self._is_repeat('log_text', text, text, kwargs):
+            self._enqueue('log_text', text, kwargs)
+
+    def log_struct(self, info: dict, **kwargs) -> None:
+        # keyed on the message alone, so the payload is not serialized on the caller's thread;
+        # entries without a text message are never deduplicated
+        message = info.get('message')
+        if not isinstance(message, str) or not self._is_repeat('log_struct', message, info, kwargs):
+            self._enqueue('log_struct', info, kwargs)
+
+    def _is_repeat(self, method: str, message, payload, kwargs: dict) -> bool:
+        # entries with the same message, severity and labels within DEDUP_WINDOW_SECONDS of the first one are counted instead of written,
+        # and a single summary entry with the count is written once the window has closed, either here,
+        # by the sweeper thread or by flush()
+        labels = kwargs.get('labels')
+        key = (method, kwargs.get('severity'), frozenset(labels.items()) if labels else None, message)
+        now = time.monotonic()
+        closed = []
+        with self._recent_lock:
+            seen = self._recent.get(key)
+            if seen is not None:
+                if now - seen[0] < DEDUP_WINDOW_SECONDS:
+                    seen[1] += 1
+                    if seen[1] == 1:
+                        _repeating_loggers.add(self)
+                        if _repeat_sweeper is None:
+                            _ensure_repeat_sweeper()
+                    return True
+                closed.append(seen)
+            self._recent[key] = [now, 0, method, payload, kwargs]
+            self._recent.move_to_end(key)
+            if len(self._recent) > DEDUP_MAX_ENTRIES:
+                closed.append(self._recent.popitem(last=False)[1])
+        for _, count, closed_method, closed_payload, closed_kwargs in closed:
+            if count:
+                self._enqueue(closed_method, self._repeat_summary(closed_method, closed_payload, count), closed_kwargs)
+        return False
+
+    def flush_repeats(self, force: bool = False) -> None:
+        # writes the summaries of closed windows, or of every window when forced
+        now = time.monotonic()
+        with self._recent_lock:
+            closed = [
+                key for key, seen in self._recent.items()
+                if seen[1] and (force or now - seen[0] >= DEDUP_WINDOW_SECONDS)
+            ]
+            closed = [self._recent.pop(key) for key in closed]
+        for _, count, closed_method, closed_payload, closed_kwargs in closed:
+            self._enqueue(closed_method, self._repeat_summary(closed_method, closed_payload, count), closed_kwargs)
+
+    @staticmethod
+    def _repeat_summary(method: str, payload, count: int):
+        if method == 'log_text':
+            return f"{payload} (repeated {count} more times)"
+        return {**payload, 'repeat_count': count}
+
+    def _enqueue(self, method: str, payload, kwargs: dict) -> None:
+        if LOG_TO_STDERR:
+            severity = kwargs.get('severity', 'DEFAULT')
+            _write_stderr(_format_structured(self.log_name, payload, severity, kwargs.get('labels')), severity)
+            return
+        if _worker is None:
+            _ensure_worker()
+        entry = (self.logger, method, payload, kwargs)
+        try:
+            log_queue.put_nowait(entry)
+        except queue.Full:
+            # drop the oldest entry rather than block the caller
+            try:
+                log_queue.get_nowait()
+                log_queue.task_done()
+            except queue.Empty:
+                pass
+            try:
+                log_queue.put_nowait(entry)
+            except queue.Full:
+                pass
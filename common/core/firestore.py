@@ -0,0 +1,179 @@
+import contextvars
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import List
+
+from firedantic import CONFIGURATIONS, Model
+from google.cloud import firestore
+from pydantic import BaseModel
+
+FIRESTORE_BATCH_MAX_WRITES = 500
+
+# the BatchedWrites collecting model saves for the current request/task, if any
+current_batch = contextvars.ContextVar('firestore_batch', default=None)
+
+
+class BatchedWrites:
+
+    def __init__(self, firestore_client: firestore.Client) -> None:
+        self.firestore_client = firestore_client
+        self.batch = None
+        self.writes = 0
+        self._token = None
+
+    def set(self, doc_ref, data: dict) -> None:
+        if self.writes == FIRESTORE_BATCH_MAX_WRITES:
+            # Firestore rejects batches above 500 operations, and committing early would break atomicity
+            raise ValueError(f"A batched write can hold at most {FIRESTORE_BATCH_MAX_WRITES} operations")
+        self.batch.set(doc_ref, data)
+        self.writes += 1
+
+    def __enter__(self):
+        self.batch = self.firestore_client.batch()
+        self._token = current_batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        current_batch.reset(self._token)
+        # nothing is written if the block failed
+        if exc_type is None and self.writes:
+            self.batch.commit()
+
+
+def batched_writes(firestore_client: firestore.Client) -> BatchedWrites:
+    """
+    Groups the model saves made inside the block into a single atomic WriteBatch commit.
+    Nothing is written if the block raises, and saving more than FIRESTORE_BATCH_MAX_WRITES
+    models inside one block raises ValueError:
+
+        with batched_writes(firestore_client):
+            account.save()
+            connection.save()
+    """
+    return BatchedWrites(firestore_client)
+
+
+def save_all(
+    models: List[Model],
+    by_alias: bool = True,
+    exclude_unset: bool = True,
+    exclude_none: bool = False
+) -> None:
+    # BulkWriter sends the writes in parallel batches instead of one set RPC per model
+    if not models:
+        return
+    bulk_writer = CONFIGURATIONS['db'].bulk_writer()
+    for model in models:
+        doc_ref = model._get_doc_ref()
+        bulk_writer.set(
+            doc_ref,
+            dump_document(model, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
+        )
+        setattr(model, model.__document_id__, doc_ref.id)
+    bulk_writer.close()
+
+
+class BulkSaveMixin:
+    """
+    Adds save_many to firedantic models whose instances are often saved together.
+    """
+
+    @classmethod
+    def save_many(
+        cls,
+        items: List[Model],
+        by_alias: bool = True,
+        exclude_unset: bool = True,
+        exclude_none: bool = False
+    ) -> None:
+        """
+        Saves the given models in the database with a single BulkWriter.
+
+        :raise DocumentIDError: If a document ID is not valid.
+        """
+        save_all(items, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
+
+
+@lru_cache(maxsize=None)
+def _dumps_field_values(model_class) -> bool:
+    # without aliases or custom serializers model_dump returns the field values unchanged,
+    # apart from the nested models it serializes
+    decorators = model_class.__pydantic_decorators__
+    return not (
+        model_class.model_config.get('alias_generator')
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or model_class.model_computed_fields
+        or any(
+            field.alias not in (None, name) or field.serialization_alias not in (None, name)
+            for name, field in model_class.model_fields.items()
+        )
+    )
+
+
+def _is_model(value) -> bool:
+    # pydantic dataclasses (e.g. Installation's Output) are serialized by model_dump just like models
+    return isinstance(value, BaseModel) or (is_dataclass(value) and not isinstance(value, type))
+
+
+def _contains_model(value) -> bool:
+    if _is_model(value):
+        return True
+    if isinstance(value, (list, tuple, set)):
+        return any(_is_model(item) for item in value)
+    if isinstance(value, dict):
+        return any(_is_model(item) for item in value.values())
+    return False
+
+
+def dump_document(
+    model: Model,
+    by_alias: bool = True,
+    exclude_unset: bool = True,
+    exclude_none: bool = False
+) -> dict:
+    """
+    Returns the same dict as model_dump(..., exclude={document id}), but copies the plain field values
+    (large Stripe payloads included) instead of running them through the pydantic serializer.
+    """
+    document_id = model.__document_id__
+    if not _dumps_field_values(type(model)):
+        return model.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={document_id}
+        )
+    values = model.__dict__
+    fields = model.__pydantic_fields_set__ if exclude_unset else model.model_fields.keys()
+    data = {}
+    nested_fields = set()
+    for field in fields:
+        if field == document_id:
+            continue
+        value = values.get(field)
+        if value is None:
+            if exclude_none:
+                continue
+        elif _contains_model(value):
+            nested_fields.add(field)
+            continue
+        data[field] = value
+    if nested_fields:
+        data.update(
+            model.model_dump(
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_none=exclude_none,
+                include=nested_fields
+            )
+        )
+    return data
+
+
+def set_document(doc_ref, data: dict) -> None:
+    batch = current_batch.get()
+    if batch is None:
+        doc_ref.set(data)
+    else:
+        batch.set(doc_ref, data)
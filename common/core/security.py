@@ -1,30 +1,67 @@
-from typing import Union
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Union
 
 import jwt
-import jwt.algorithms
 import requests
 from dependency_injector.wiring import inject
 from fastapi import HTTPException, status, Header
-from jwt import ExpiredSignatureError, InvalidSignatureError, InvalidAudienceError
+from jwt import DecodeError, ExpiredSignatureError, InvalidSignatureError, InvalidAudienceError, PyJWKClientError
+from requests.adapters import HTTPAdapter
 
-from common.core.utils import timed_lru_cache
 from common.services.metadata import MetadataService
 
 OIDC_ENDPOINT = 'https://accounts.google.com/.well-known/openid-configuration'
-CERTS = None
+VERIFIED_TOKENS_MAXSIZE = 4096
 
+# keep-alive session so JWKS refreshes reuse a warm TLS connection
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
-@timed_lru_cache(seconds=30)
-def get_google_certs():
-    config = requests.get(OIDC_ENDPOINT).json()
-    return requests.get(config['jwks_uri']).json()
+# raw bearer token -> `exp` claim of tokens that already passed verification
+_verified_tokens: Dict[str, int] = {}
+_verified_tokens_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_google_jwks_client() -> jwt.PyJWKClient:
+    config = http_session.get(OIDC_ENDPOINT, timeout=10).json()
+    return jwt.PyJWKClient(config['jwks_uri'], cache_keys=True, lifespan=3600)
+
+
+@lru_cache(maxsize=1)
+def get_google_audience() -> str:
+    return MetadataService().public_url
+
+
+def _is_token_verified(token: str) -> bool:
+    with _verified_tokens_lock:
+        exp = _verified_tokens.get(token)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            del _verified_tokens[token]
+            return False
+        return True
+
+
+def _remember_verified_token(token: str, exp: int) -> None:
+    with _verified_tokens_lock:
+        if len(_verified_tokens) >= VERIFIED_TOKENS_MAXSIZE:
+            now = time.time()
+            for expired_token in [t for t, e in _verified_tokens.items() if e <= now]:
+                del _verified_tokens[expired_token]
+            if len(_verified_tokens) >= VERIFIED_TOKENS_MAXSIZE:
+                # evict the oldest entry
+                del _verified_tokens[next(iter(_verified_tokens))]
+        _verified_tokens[token] = exp
 
 
 @inject
 def verify_google(
     authorization: Union[str, None] = Header(default=None),
 ):
-    metadata_service = MetadataService()
     if not authorization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,23 +69,22 @@ def verify_google(
         )
 
     token = authorization.replace('Bearer ', '')
-
-    global CERTS
-    if CERTS is None:
-        CERTS = get_google_certs()
-    public_keys = {}
-    for jwk in CERTS['keys']:
-        kid = jwk.get('kid')
-        if not kid:
-            return
-        public_keys[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
-    kid = jwt.get_unverified_header(token)['kid']
-    key = public_keys.get(kid)
-    if not key:
+    # only successful verifications are cached, so a hit skips the RS256 check
+    if _is_token_verified(token):
         return
 
     try:
-        payload = jwt.decode(token, key=key, algorithms=['RS256'], audience=metadata_service.public_url)
+        key = get_google_jwks_client().get_signing_key_from_jwt(token).key
+    except (PyJWKClientError, DecodeError):
+        # no kid in the header, a malformed token or the Google certs could not be fetched
+        print(f"Unable to find a Google signing key for ({token})")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unable to validate token. Please use a valid token from google"
+        )
+
+    try:
+        payload = jwt.decode(token, key=key, algorithms=['RS256'], audience=get_google_audience())
         if payload['iss'] != 'https://accounts.google.com':
             print(f"Issuer is invalid: {payload['iss']} != https://accounts.google.com")
             print(f"Failed to validate JWT: {token}")
@@ -56,6 +92,7 @@ def verify_google(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Unauthorized. Please use a valid token from google"
             )
+        _remember_verified_token(token, payload['exp'])
     except ExpiredSignatureError:
         print(f"Signature has expired for ({token})")
         raise HTTPException(
@@ -2,13 +2,23 @@ import json
 import random
 import re
 import string
-from datetime import timedelta, datetime
+import time
 from functools import lru_cache, wraps
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_START_CHARS = frozenset('{["-0123456789tfn')
+STRIP_QUOTES_TABLE = str.maketrans('', '', '"')
+SPECIAL_CHARS_REGEX = re.compile(r'[^0-9a-zA-Z_. ]')
+NON_ALPHANUMERIC_REGEX = re.compile(r'[^0-9a-zA-Z]+')
+NON_WORD_REGEX = re.compile(r'[\W_]+')
+
 
 def randomword(length):
-    letters = string.ascii_lowercase
-    return ''.join(random.choice(letters) for i in range(length))
+    return ''.join(random.choices(string.ascii_lowercase, k=length))
 
 
 def is_json(value):
@@ -16,24 +26,40 @@ def is_json(value):
         return False
     if not isinstance(value, str):
         return False
+    stripped = value.lstrip()
+    if not stripped or stripped[0] not in JSON_START_CHARS:
+        return False
     try:
-        json.loads(value)
+        orjson.loads(value) if orjson else json.loads(value)
     except ValueError:
         return False
     return True
 
 
+def is_valid_url(value: str) -> bool:
+    # scheme followed by a non-empty host, without the cost of urlparse
+    if value.startswith('https://'):
+        host_start = 8
+    elif value.startswith('http://'):
+        host_start = 7
+    else:
+        return False
+    host_end = value.find('/', host_start)
+    return host_end > host_start or (host_end == -1 and len(value) > host_start)
+
+
 def timed_lru_cache(seconds: int, maxsize: int = 128):
     def wrapper_cache(func):
         func = lru_cache(maxsize=maxsize)(func)
-        func.lifetime = timedelta(seconds=seconds)
-        func.expiration = datetime.utcnow() + func.lifetime
+        func.lifetime = seconds
+        func.expiration = time.monotonic() + func.lifetime
 
         @wraps(func)
         def wrapped_func(*args, **kwargs):
-            if datetime.utcnow() >= func.expiration:
+            now = time.monotonic()
+            if now >= func.expiration:
                 func.cache_clear()
-                func.expiration = datetime.utcnow() + func.lifetime
+                func.expiration = now + func.lifetime
 
             return func(*args, **kwargs)
 
@@ -53,13 +79,14 @@ def to_title_case(snake_case_string):
     return title_case_string
 
 
+@lru_cache(maxsize=8192)
 def format_sf(text, suffix=None, safe=False):
-    text = re.sub(r'"+', '', text)
-    has_special_chars = re.search(r'[^0-9a-zA-Z_. ]', text)
+    text = text.translate(STRIP_QUOTES_TABLE)
+    has_special_chars = SPECIAL_CHARS_REGEX.search(text)
     if has_special_chars:
-        text = re.sub(r'[^0-9a-zA-Z]+', '_', text) if safe else f"\"{text}\""
+        text = NON_ALPHANUMERIC_REGEX.sub('_', text) if safe else f"\"{text}\""
     else:
-        text = re.sub(r'[\W_]+', '_', text)
+        text = NON_WORD_REGEX.sub('_', text)
     if text[0].isdigit():
         text = f"n_{text}"
     if suffix:
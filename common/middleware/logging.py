@@ -1,17 +1,38 @@
+import os
+import threading
 import time
-import uuid
+from collections import deque
 
-from google.cloud import logging
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import Message
 
+from common.core.cloud_logging import BackgroundLogger, get_logging_client
+
+REQUEST_ID_POOL_SIZE = 256
+
+# request ids are generated in bulk from a single os.urandom read
+_request_ids = deque()
+_request_ids_lock = threading.Lock()
+# a forked worker must not hand out the ids its parent already has pooled
+os.register_at_fork(after_in_child=_request_ids.clear)
+
+
+def next_request_id() -> str:
+    while True:
+        try:
+            return _request_ids.popleft()
+        except IndexError:
+            with _request_ids_lock:
+                if not _request_ids:
+                    random_bytes = os.urandom(16 * REQUEST_ID_POOL_SIZE)
+                    _request_ids.extend(random_bytes[i:i + 16].hex() for i in range(0, len(random_bytes), 16))
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     def __init__(self, app):
         super().__init__(app)
         log_name = 'middleware'
-        logging_client = logging.Client()
-        self.logger = logging_client.logger(log_name)
+        self.logger = BackgroundLogger(get_logging_client().logger(log_name))
 
     @staticmethod
     async def set_body(request):
@@ -23,14 +44,16 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         request._receive = receive
 
     async def dispatch(self, request, call_next):
-        req_uuid = str(uuid.uuid4())
+        req_uuid = next_request_id()
         await self.set_body(request)
         body = await request.body()
+        method = request.method.upper()
+        url = str(request.url)
         request_details = {
             "uuid": req_uuid,
             "type": "api-request",
-            "method": str(request.method).upper(),
-            "url": str(request.url),
+            "method": method,
+            "url": url,
             "headers": str(request.headers),
             "payload": body[:1200] if body else None,
         }
@@ -38,17 +61,16 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             f"Request: {request_details}",
             severity='INFO'
         )
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-        formatted_process_time = "{0:.2f}".format(process_time)
+        process_time = (time.perf_counter() - start_time) * 1000
         response_details = {
             "uuid": req_uuid,
             "type": "api-response",
-            "url": f"[{str(request.method).upper()}] {str(request.url)}",
+            "url": f"[{method}] {url}",
             "headers": str(response.headers),
             "code": response.status_code,
-            "elapsed_time": f"{formatted_process_time}ms",
+            "elapsed_time": f"{process_time:.2f}ms",
         }
         self.logger.log_text(
             f"Response: {response_details}",
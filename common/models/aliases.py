@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from pydantic import ConfigDict, alias_generators
+
+# the same field names repeat across many models, so each alias is only generated once per process
+to_camel = lru_cache(maxsize=None)(alias_generators.to_camel)
+to_pascal = lru_cache(maxsize=None)(alias_generators.to_pascal)
+
+# shared by the camelCase and PascalCase API models instead of repeating the same Config block in every class
+CAMEL_CONFIG = ConfigDict(populate_by_name=True, alias_generator=to_camel, defer_build=True)
+PASCAL_CONFIG = ConfigDict(populate_by_name=True, alias_generator=to_pascal, defer_build=True)
@@ -0,0 +1,37 @@
+import importlib
+
+# model name -> defining module; a module is only imported once one of its models is used
+_LAZY = {
+    'AccountSource': 'common.models.firestore.accounts',
+    'Account': 'common.models.firestore.accounts',
+    'FieldItem': 'common.models.firestore.applications',
+    'FieldInput': 'common.models.firestore.applications',
+    'Application': 'common.models.firestore.applications',
+    'AuthMethod': 'common.models.firestore.connections',
+    'Authorization': 'common.models.firestore.connections',
+    'Connection': 'common.models.firestore.connections',
+    'BulkEnrollment': 'common.models.firestore.enrollments',
+    'FeatureGroup': 'common.models.firestore.feature_groups',
+    'FeatureEvent': 'common.models.firestore.features',
+    'FeatureType': 'common.models.firestore.features',
+    'Feature': 'common.models.firestore.features',
+    'Output': 'common.models.firestore.installations',
+    'Installation': 'common.models.firestore.installations',
+    'Integration': 'common.models.firestore.integrations',
+    'Price': 'common.models.firestore.prices',
+    'Product': 'common.models.firestore.products',
+    'CreateRecordResponse': 'common.models.firestore.responses',
+    'Subscription': 'common.models.firestore.subscriptions',
+    'User': 'common.models.firestore.users'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
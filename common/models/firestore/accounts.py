@@ -2,12 +2,16 @@ from datetime import datetime
 from typing import Optional
 
 from firedantic import Model
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.core.firestore import set_document
 
 
 class AccountSource(BaseModel):
     integration_name: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Account(Model):
     __collection__ = 'accounts'
@@ -15,22 +19,27 @@ class Account(Model):
     account_identifier: Optional[str] = None
     stripe_customer_id: Optional[str] = None
     hs_company_id: Optional[str] = None
-    created_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = Field(default_factory=datetime.now)
     active: Optional[bool] = None
     source: Optional[AccountSource] = None
     monday_account_id: Optional[int] = None
     monday_account_slug: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
-        doc_ref.set(data)
+        set_document(doc_ref, data)
         setattr(self, self.__document_id__, doc_ref.id)
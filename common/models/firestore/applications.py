@@ -1,13 +1,17 @@
 from typing import Optional, List, Any, Dict
 
 from firedantic import Model
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.core.firestore import set_document
 
 
 class FieldItem(BaseModel):
     key: str
     value: Any
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class FieldInput(BaseModel):
     name: Optional[str] = None
@@ -20,29 +24,36 @@ class FieldInput(BaseModel):
     conditionally_display_on_field: Optional[str] = None
     conditionally_display_on_field_value: Optional[Any] = None
     hide_text: Optional[bool] = None
-    items: Optional[List[FieldItem]] = []
+    items: Optional[List[FieldItem]] = Field(default_factory=list)
     visible: Optional[bool] = None
     required: Optional[bool] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Application(Model):
     __collection__ = 'apps'
     name: str
     label: str
     icon: Optional[str] = None
-    required_inputs: Optional[List[FieldInput]] = []
+    required_inputs: Optional[List[FieldInput]] = Field(default_factory=list)
     integration_id: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
-        doc_ref.set(data)
+        set_document(doc_ref, data)
         setattr(self, self.__document_id__, doc_ref.id)
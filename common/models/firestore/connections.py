@@ -1,9 +1,17 @@
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, List
 
 from firedantic import SubModel, SubCollection
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.core.firestore import BulkSaveMixin, set_document
+
+CONNECTION_MODELS_MAXSIZE = 1024
+
+# (model class, installation id) -> subclass bound to that installation's connections collection
+_connection_models = {}
 
 
 class AuthMethod(str, Enum):
@@ -34,14 +42,16 @@ class Authorization(BaseModel):
     expires_in: Optional[int] = 0
     refresh_token: Optional[str] = None
     token_type: Optional[str] = None
-    expires_at: Optional[int] = int(datetime.now().timestamp()) + expires_in
+    expires_at: Optional[int] = Field(default_factory=lambda: int(time.time()))
     id_token: Optional[str] = None
 
     # HubSpot
     private_token: Optional[bool] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class Connection(SubModel):
+class Connection(BulkSaveMixin, SubModel):
     account_identifier: Optional[str] = None
     account_id: Optional[str] = None
     authorized_by_id: Optional[str] = None
@@ -50,22 +60,50 @@ class Connection(SubModel):
     connected: Optional[bool] = False
     connected_at: Optional[datetime] = None
     connection_error: Optional[str] = None
-    created_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = Field(default_factory=datetime.now)
     ever_connected: Optional[bool] = False
 
+    model_config = ConfigDict(defer_build=True)
+
     class Collection(SubCollection):
         __collection_tpl__ = 'installations/{id}/connections'
 
+    @classmethod
+    def model_for(cls, parent):
+        # firedantic dumps the parent and builds a new model class (and pydantic schema) on every call,
+        # while __collection_tpl__ only depends on the installation id
+        key = (cls, parent.id)
+        model = _connection_models.get(key)
+        if model is None:
+            if len(_connection_models) >= CONNECTION_MODELS_MAXSIZE:
+                del _connection_models[next(iter(_connection_models))]
+            model = _connection_models[key] = super().model_for(parent)
+        return model
+
+    @classmethod
+    def save_many(
+        cls,
+        items: List['Connection'],
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_none: bool = False
+    ) -> None:
+        # unset fields are written too, like save() does
+        super().save_many(items, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = False, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
-        doc_ref.set(data)
+        set_document(doc_ref, data)
         setattr(self, self.__document_id__, doc_ref.id)
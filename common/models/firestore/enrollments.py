@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BulkEnrollment(BaseModel):
@@ -13,3 +13,5 @@ class BulkEnrollment(BaseModel):
     completed: Optional[bool] = None
     expires: Optional[datetime] = None
     job_id: Optional[int] = None
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from firedantic import Model
+from pydantic import ConfigDict
 
 
 class FeatureGroup(Model):
@@ -8,15 +9,20 @@ class FeatureGroup(Model):
     name: Optional[str] = None
     integration_id: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
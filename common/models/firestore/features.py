@@ -2,6 +2,9 @@ from enum import Enum
 from typing import Optional
 
 from firedantic import Model
+from pydantic import ConfigDict
+
+from common.core.firestore import BulkSaveMixin
 
 
 class FeatureEvent(str, Enum):
@@ -24,7 +27,7 @@ class FeatureType(str, Enum):
     DELETE_PULSE = 'delete_pulse'
 
 
-class Feature(Model):
+class Feature(BulkSaveMixin, Model):
     __collection__ = 'features'
     name: Optional[str] = None
     integration_id: Optional[str] = None
@@ -34,15 +37,21 @@ class Feature(Model):
     event: Optional[FeatureEvent] = None
     type: Optional[FeatureType] = None
 
+    # event and type are kept as their plain string values, which is what gets written to Firestore
+    model_config = ConfigDict(defer_build=True, use_enum_values=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
@@ -2,15 +2,20 @@ from datetime import datetime
 from typing import Optional, List
 
 from firedantic import Model
-from pydantic import BaseModel
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
+from common.core.firestore import BulkSaveMixin
 
-class Output(BaseModel):
+
+# only ever (de)serialized as part of Installation.final_output, so a slotted dataclass is enough
+@dataclass(slots=True)
+class Output:
     name: str
     url: str
 
 
-class Installation(Model):
+class Installation(BulkSaveMixin, Model):
     __collection__ = 'installations'
     integration_name: Optional[str] = None
     account_identifier: Optional[str] = None
@@ -24,7 +29,7 @@ class Installation(Model):
     active: Optional[bool] = False
     installation_in_progress: Optional[bool] = False
     installed_at: Optional[datetime] = None
-    created_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = Field(default_factory=datetime.now)
     uninstalled_at: Optional[datetime] = None
     uninstallation_in_progress: Optional[bool] = False
     activated_at: Optional[datetime] = None
@@ -33,15 +38,20 @@ class Installation(Model):
     final_output: Optional[List[Output]] = None
     metadata: Optional[dict] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = self.model_dump(
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude={self.__document_id__}
+        )
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
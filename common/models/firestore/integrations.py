@@ -1,6 +1,7 @@
 from typing import Optional, List
 
 from firedantic import Model
+from pydantic import ConfigDict, Field
 
 from common.models.firestore.applications import FieldInput
 
@@ -9,14 +10,16 @@ class Integration(Model):
     __collection__ = 'integrations'
     label: Optional[str] = None
     name: Optional[str] = None
-    required_application_ids: Optional[List[str]] = []
+    required_application_ids: Optional[List[str]] = Field(default_factory=list)
     identity_application_id: Optional[str] = None
     external_billing: Optional[bool] = None
     default_product_id: Optional[str] = None
     one_time_product_id: Optional[str] = None
-    product_ids: Optional[List[str]] = []
-    required_inputs: Optional[List[FieldInput]] = []
+    product_ids: Optional[List[str]] = Field(default_factory=list)
+    required_inputs: Optional[List[FieldInput]] = Field(default_factory=list)
     stripe_billing_portal_config_id: Optional[str] = None
     installable: Optional[bool] = None
     default_back_to_url: Optional[str] = None
     total_installation_steps: Optional[int] = 1
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,6 +1,9 @@
-from typing import Optional
+from typing import Any, Optional
 
 from firedantic import Model
+from pydantic import ConfigDict
+
+from common.core.firestore import dump_document
 
 
 class Price(Model):
@@ -8,20 +11,19 @@ class Price(Model):
     name: Optional[str] = None
     product_id: Optional[str] = None
     stripe_id: Optional[str] = None
-    stripe_object: Optional[dict] = None
+    stripe_object: Optional[Any] = None
     monday_billing_period: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = dump_document(self, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
         setattr(self, self.__document_id__, doc_ref.id)
-
@@ -1,11 +1,13 @@
-from typing import Optional, List
+from typing import Any, Optional, List
 
 from firedantic import Model
+from pydantic import ConfigDict
 
+from common.core.firestore import BulkSaveMixin, dump_document
 from common.models.firestore.prices import Price
 
 
-class Product(Model):
+class Product(BulkSaveMixin, Model):
     __collection__ = 'products'
     name: Optional[str] = None
     category: Optional[str] = None
@@ -14,20 +16,20 @@ class Product(Model):
     stripe_id: Optional[str] = None
     hs_product_id: Optional[str] = None
     allow_trial: Optional[bool] = False
-    stripe_object: Optional[dict] = None
+    stripe_object: Optional[Any] = None
     feature_group_ids: Optional[List[str]] = None
     prices: Optional[List[Price]] = None
     monday_plan_id: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = dump_document(self, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateRecordResponse(BaseModel):
     id: str
+
+    model_config = ConfigDict(defer_build=True)
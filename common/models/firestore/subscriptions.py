@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Optional, List
 
 from firedantic import Model
+from pydantic import ConfigDict, Field
 
+from common.core.firestore import BulkSaveMixin, dump_document
 from common.models.monday.app_events import Subscription as MondaySubscription
 
 
-class Subscription(Model):
+class Subscription(BulkSaveMixin, Model):
     __collection__ = 'subscriptions'
     account_id: Optional[str] = None
     stripe_id: Optional[str] = None
@@ -15,22 +17,23 @@ class Subscription(Model):
     price_ids: Optional[List[str]] = None
     active: Optional[bool] = False
     is_trial: Optional[bool] = False
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=datetime.now)
     ended_at: Optional[datetime] = None
     cancel_at_period_end: Optional[bool] = False
     checkout_session_id: Optional[str] = None
-    stripe_object: Optional[dict] = None
+    # Stripe payloads are stored as received, without validating or copying every nested value
+    stripe_object: Optional[Any] = None
     monday_object: Optional[MondaySubscription] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = False, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = dump_document(self, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
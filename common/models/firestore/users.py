@@ -1,9 +1,12 @@
 from typing import Optional
 
 from firedantic import Model
+from pydantic import ConfigDict
 
+from common.core.firestore import BulkSaveMixin, dump_document
 
-class User(Model):
+
+class User(BulkSaveMixin, Model):
     __collection__ = 'users'
     email: Optional[str] = None
     first_name: Optional[str] = None
@@ -13,15 +16,15 @@ class User(Model):
     anvil_user_id: Optional[str] = None
     monday_user_id: Optional[int] = None
 
+    model_config = ConfigDict(defer_build=True)
+
     def save(self, by_alias: bool = True, exclude_unset: bool = True, exclude_none: bool = False) -> None:
         """
         Saves this model in the database.
 
         :raise DocumentIDError: If the document ID is not valid.
         """
-        data = self.model_dump(by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        if self.__document_id__ in data:
-            del data[self.__document_id__]
+        data = dump_document(self, by_alias=by_alias, exclude_unset=exclude_unset, exclude_none=exclude_none)
 
         doc_ref = self._get_doc_ref()
         doc_ref.set(data)
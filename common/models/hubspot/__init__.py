@@ -0,0 +1,61 @@
+import importlib
+
+# model name -> defining module; a module is only imported once one of its models is used
+_LAZY = {
+    'HubSpotCRMCardActionType': 'common.models.hubspot.crm_cards',
+    'HubSpotCRMCardActionModel': 'common.models.hubspot.crm_cards',
+    'HubSpotCRMCardModel': 'common.models.hubspot.crm_cards',
+    'TopLevelAction': 'common.models.hubspot.crm_cards',
+    'TopLevelActions': 'common.models.hubspot.crm_cards',
+    'Token': 'common.models.hubspot.crm_cards',
+    'Action': 'common.models.hubspot.crm_cards',
+    'Section': 'common.models.hubspot.crm_cards',
+    'CRMCard': 'common.models.hubspot.crm_cards',
+    'FileOptions': 'common.models.hubspot.files',
+    'MarketingEvent': 'common.models.hubspot.marketing_events',
+    'Registration': 'common.models.hubspot.marketing_events',
+    'HubSpotSettingsIframeModel': 'common.models.hubspot.settings',
+    'HubSpotSettingsIframeResponseModel': 'common.models.hubspot.settings',
+    'HubSpotAppSettingsActionTypeModel': 'common.models.hubspot.settings',
+    'HubSpotSettingsToggleStatusModel': 'common.models.hubspot.settings',
+    'HubSpotSettingsToggleUpdateModel': 'common.models.hubspot.settings',
+    'HubSpotAppSettingsModel': 'common.models.hubspot.settings',
+    'HubSpotAccountSettingsModel': 'common.models.hubspot.settings',
+    'HubSpotSettingsAccountListModel': 'common.models.hubspot.settings',
+    'HubSpotAccountsFetchResponseModel': 'common.models.hubspot.settings',
+    'HubSpotAccountDetails': 'common.models.hubspot.settings',
+    'TimelineIFrame': 'common.models.hubspot.timeline_events',
+    'TimelineEvent': 'common.models.hubspot.timeline_events',
+    'HubSpotAppWebhookEvent': 'common.models.hubspot.webhooks',
+    'HubSpotWorkflowWebhookEvent': 'common.models.hubspot.webhooks',
+    'ExecutionState': 'common.models.hubspot.workflow_actions',
+    'WorkflowOptionsOrigin': 'common.models.hubspot.workflow_actions',
+    'WorkflowFetchOptions': 'common.models.hubspot.workflow_actions',
+    'WorkflowOptionsRequest': 'common.models.hubspot.workflow_actions',
+    'WorkflowFieldOption': 'common.models.hubspot.workflow_actions',
+    'WorkflowOptionsResponse': 'common.models.hubspot.workflow_actions',
+    'ActionExecutionIndex': 'common.models.hubspot.workflow_actions',
+    'ActionOrigin': 'common.models.hubspot.workflow_actions',
+    'ActionContext': 'common.models.hubspot.workflow_actions',
+    'ActionObject': 'common.models.hubspot.workflow_actions',
+    'Operator': 'common.models.hubspot.workflow_actions',
+    'ActionInputFields': 'common.models.hubspot.workflow_actions',
+    'WorkflowActionExecution': 'common.models.hubspot.workflow_actions',
+    'ErrorCode': 'common.models.hubspot.workflow_actions',
+    'ActionOutputFields': 'common.models.hubspot.workflow_actions',
+    'WorkflowActionOutput': 'common.models.hubspot.workflow_actions',
+    'WorkflowActionCallback': 'common.models.hubspot.workflow_actions',
+    'HubSpotWorkflowActionCallbackBatchModel': 'common.models.hubspot.workflow_actions',
+    'HubSpotWorkflowException': 'common.models.hubspot.workflow_actions'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
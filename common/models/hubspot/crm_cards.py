@@ -1,8 +1,9 @@
 from enum import Enum
 from typing import List, Optional, Any
 
-from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+from pydantic import BaseModel, ConfigDict
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class HubSpotCRMCardActionType(str, Enum):
@@ -22,18 +23,14 @@ class HubSpotCRMCardActionModel(BaseModel):
     confirm_button_text: Optional[str] = None
     cancel_button_text: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = ConfigDict(**CAMEL_CONFIG, use_enum_values=True)
 
 
 class HubSpotCRMCardModel(BaseModel):
     results: Optional[List]
     primary_action: HubSpotCRMCardActionModel
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class TopLevelAction(BaseModel):
@@ -44,9 +41,7 @@ class TopLevelAction(BaseModel):
     label: str
     property_names_included: Optional[List[str]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = ConfigDict(**CAMEL_CONFIG, use_enum_values=True)
 
 
 class TopLevelActions(BaseModel):
@@ -54,6 +49,8 @@ class TopLevelActions(BaseModel):
     primary: Optional[TopLevelAction]
     secondary: Optional[List[TopLevelAction]]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Token(BaseModel):
     name: str
@@ -61,6 +58,8 @@ class Token(BaseModel):
     dataType: str
     value: Any
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Action(BaseModel):
     type: str = "ACTION_HOOK"
@@ -70,9 +69,7 @@ class Action(BaseModel):
     label: str
     property_names_included: Optional[List[str]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class Section(BaseModel):
@@ -82,9 +79,7 @@ class Section(BaseModel):
     tokens: Optional[List[Token]]
     actions: Optional[List[Action]]
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class CRMCard(BaseModel):
@@ -94,6 +89,4 @@ class CRMCard(BaseModel):
     top_level_actions: Optional[TopLevelActions]
     sections: Optional[List[Section]]
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
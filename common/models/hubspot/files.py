@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class FileOptions(BaseModel):
@@ -9,3 +9,5 @@ class FileOptions(BaseModel):
     overwrite: Optional[bool] = None
     duplicate_validation_strategy: Optional[str] = None
     duplicate_validation_scope: Optional[str] = None
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,8 +1,16 @@
-from datetime import datetime
+import time
 from typing import Optional
 
-from pydantic import BaseModel, field_serializer
-from pydantic.alias_generators import to_camel
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+from common.models.aliases import CAMEL_CONFIG
+
+# identical for every custom property of every event
+CUSTOM_PROPERTY_SOURCE = {
+    "sourceId": "express_integrations_marketing_events",
+    "sourceLabel": "Express Integrations Marketing Events",
+    "source": "API"
+}
 
 
 class MarketingEvent(BaseModel):
@@ -17,23 +25,14 @@ class MarketingEvent(BaseModel):
     external_event_id: str
     custom_properties: Optional[dict]
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
-    @field_serializer('custom_properties')
+    @field_serializer('custom_properties', when_used='unless-none')
     def serialize_custom_properties(self, data: dict, _info):
-        now = int(datetime.now().timestamp() * 1000)
-        return [
-            {
-                "name": k,
-                "value": v,
-                "timestamp": now,
-                "sourceId": "express_integrations_marketing_events",
-                "sourceLabel": "Express Integrations Marketing Events",
-                "source": "API"
-            } for k, v in data.items()
-        ] if data else None
+        if not data:
+            return None
+        now = int(time.time() * 1000)
+        return [{"name": k, "value": v, "timestamp": now, **CUSTOM_PROPERTY_SOURCE} for k, v in data.items()]
 
 
 class Registration(BaseModel):
@@ -42,3 +41,5 @@ class Registration(BaseModel):
     contact_id: int
     subscriber_state: str
     timestamp: int
+
+    model_config = ConfigDict(defer_build=True)
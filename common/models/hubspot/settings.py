@@ -1,17 +1,22 @@
 from enum import Enum
 from typing import Optional, List
 
-from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+from pydantic import BaseModel, ConfigDict
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class HubSpotSettingsIframeModel(BaseModel):
     iframeUrl: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotSettingsIframeResponseModel(BaseModel):
     response: HubSpotSettingsIframeModel
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotAppSettingsActionTypeModel(str, Enum):
     ACCOUNTS_FETCH = "ACCOUNTS_FETCH"
@@ -26,11 +31,15 @@ class HubSpotAppSettingsActionTypeModel(str, Enum):
 class HubSpotSettingsToggleStatusModel(BaseModel):
     enabled: bool
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotSettingsToggleUpdateModel(BaseModel):
     response: HubSpotSettingsToggleStatusModel
     message: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotAppSettingsModel(BaseModel):
     action_type: HubSpotAppSettingsActionTypeModel
@@ -41,9 +50,7 @@ class HubSpotAppSettingsModel(BaseModel):
     account_id: Optional[str] = None
     enabled: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class HubSpotAccountSettingsModel(BaseModel):
@@ -51,18 +58,20 @@ class HubSpotAccountSettingsModel(BaseModel):
     account_name: Optional[str] = None
     account_logo_url: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class HubSpotSettingsAccountListModel(BaseModel):
     accounts: List[HubSpotAccountSettingsModel]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotAccountsFetchResponseModel(BaseModel):
     response: HubSpotSettingsAccountListModel
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class HubSpotAccountDetails(BaseModel):
     portal_id: int
@@ -75,6 +84,4 @@ class HubSpotAccountDetails(BaseModel):
     ui_domain: str
     data_hosting_location: str
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
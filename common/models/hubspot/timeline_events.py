@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class TimelineIFrame(BaseModel):
@@ -12,9 +13,7 @@ class TimelineIFrame(BaseModel):
     width: int
     height: int
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class TimelineEvent(BaseModel):
@@ -28,6 +27,4 @@ class TimelineEvent(BaseModel):
     timestamp: Optional[datetime] = None
     tokens: dict
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
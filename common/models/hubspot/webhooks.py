@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import List, Optional
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class HubSpotAppWebhookEvent(BaseModel):
@@ -22,7 +23,7 @@ class HubSpotAppWebhookEvent(BaseModel):
     association_removed: Optional[bool] = None
     is_primary_association: Optional[bool] = None
     primary_object_id: Optional[int] = None
-    merged_object_ids: Optional[List[int]]
+    merged_object_ids: Optional[List[int]] = None
     new_object_id: Optional[int] = None
     number_of_properties_moved: Optional[int] = None
     object_id: Optional[int] = None
@@ -31,9 +32,7 @@ class HubSpotAppWebhookEvent(BaseModel):
     message_id: Optional[int] = None
     message_type: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class HubSpotWorkflowWebhookEvent(BaseModel):
@@ -42,6 +41,4 @@ class HubSpotWorkflowWebhookEvent(BaseModel):
     object_id: Optional[int] = None
     properties: Optional[dict]
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
@@ -3,8 +3,12 @@ from __future__ import annotations
 from enum import Enum
 from typing import List, Optional, Any
 
-from pydantic import BaseModel, Field
-from pydantic.alias_generators import to_camel
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.models.aliases import CAMEL_CONFIG
+
+# HubSpot accepts at most 100 callbacks per batch completion request
+CALLBACK_BATCH_MAX_INPUTS = 100
 
 
 class ExecutionState(str, Enum):
@@ -22,15 +26,15 @@ class WorkflowOptionsOrigin(BaseModel):
     extension_definition_id: Optional[int] = None
     extension_definition_version_id: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class WorkflowFetchOptions(BaseModel):
     q: Optional[str] = None
     after: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class WorkflowOptionsRequest(BaseModel):
     origin: WorkflowOptionsOrigin
@@ -42,9 +46,7 @@ class WorkflowOptionsRequest(BaseModel):
     extension_definition_id: Optional[int] = None
     extension_definition_version: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class WorkflowFieldOption(BaseModel):
@@ -52,20 +54,22 @@ class WorkflowFieldOption(BaseModel):
     description: str
     value: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class WorkflowOptionsResponse(BaseModel):
     options: List[WorkflowFieldOption]
     after: Optional[str] = None
     searchable: Optional[bool] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ActionExecutionIndex(BaseModel):
     enrollment_id: Optional[int] = None
     action_execution_index: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ActionOrigin(BaseModel):
@@ -76,27 +80,21 @@ class ActionOrigin(BaseModel):
     extension_definition_id: Optional[int] = None
     extension_definition_version_id: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ActionContext(BaseModel):
     source: Optional[str] = None
     workflow_id: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ActionObject(BaseModel):
     object_id: Optional[int] = None
     object_type: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class Operator(str, Enum):
@@ -127,6 +125,8 @@ class ActionInputFields(BaseModel):
     property_value: Optional[Any] = None
     operator: Optional[Operator] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class WorkflowActionExecution(BaseModel):
     callback_id: Optional[str] = None
@@ -135,9 +135,7 @@ class WorkflowActionExecution(BaseModel):
     object: Optional[ActionObject] = None
     input_fields: Optional[ActionInputFields] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ErrorCode(str, Enum):
@@ -155,31 +153,26 @@ class ActionOutputFields(BaseModel):
     attempted_correction: Optional[str] = None
     result: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True, defer_build=True)
 
 
 class WorkflowActionOutput(BaseModel):
     output_fields: ActionOutputFields
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class WorkflowActionCallback(BaseModel):
     output_fields: ActionOutputFields
     callback_id: str = Field(default=None, alias='callbackId')
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class HubSpotWorkflowActionCallbackBatchModel(BaseModel):
     inputs: List[WorkflowActionCallback]
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class HubSpotWorkflowException(Exception):
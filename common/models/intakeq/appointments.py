@@ -3,7 +3,8 @@ from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, field_serializer
-from pydantic.alias_generators import to_pascal
+
+from common.models.aliases import PASCAL_CONFIG
 
 from common.models.intakeq.practitioners import Practitioner
 
@@ -23,9 +24,7 @@ class TelehealthInfo(BaseModel):
     provider: Optional[str] = None
     invitation_code: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Procedure(BaseModel):
@@ -34,9 +33,7 @@ class Procedure(BaseModel):
     units: Optional[int] = None
     modifiers: Optional[List[str]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class AdditionalClient(BaseModel):
@@ -46,9 +43,7 @@ class AdditionalClient(BaseModel):
     client_phone: Optional[str] = None
     intake_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Appointment(BaseModel):
@@ -80,9 +75,7 @@ class Appointment(BaseModel):
     procedures: Optional[List[Procedure]] = None
     additional_clients: Optional[List[AdditionalClient]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class ReminderType(str, Enum):
@@ -106,9 +99,7 @@ class CreateAppointmentRequest(BaseModel):
     def serialize_dt(self, dt: datetime, _info):
         return dt.timestamp() * 1000
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class UpdateAppointmentRequest(BaseModel):
@@ -124,18 +115,14 @@ class UpdateAppointmentRequest(BaseModel):
     def serialize_dt(self, dt: datetime, _info):
         return dt.timestamp() * 1000
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class CancelAppointmentRequest(BaseModel):
     appointment_id: Optional[str] = None
     reason: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class EventType(str, Enum):
@@ -157,9 +144,7 @@ class AppointmentWebhook(BaseModel):
     external_practice_id: Optional[str] = None
     external_client_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Location(BaseModel):
@@ -167,9 +152,7 @@ class Location(BaseModel):
     name: Optional[str] = None
     address: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Service(BaseModel):
@@ -178,9 +161,7 @@ class Service(BaseModel):
     duration: Optional[int] = None
     price: Optional[float] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class AppointmentSettings(BaseModel):
@@ -188,6 +169,4 @@ class AppointmentSettings(BaseModel):
     services: Optional[List[Service]] = None
     practitioners: Optional[List[Practitioner]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_pascal
+
+from common.models.aliases import PASCAL_CONFIG
 
 
 class BillingType(int, Enum):
@@ -16,19 +17,17 @@ class RelationshipType(int, Enum):
     NONE = 0
     PARENT = 1
     CHILD = 2
-    SPOUSE = 2
-    SIBLING = 2
-    OTHER = 2
-    PARTNER = 2
+    SPOUSE = 3
+    SIBLING = 4
+    OTHER = 5
+    PARTNER = 6
 
 
 class LinkedClient(BaseModel):
     client_number: Optional[int] = None
     relationship_type: Optional[RelationshipType] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class CustomField(BaseModel):
@@ -36,9 +35,7 @@ class CustomField(BaseModel):
     text: Optional[str] = None
     value: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Client(BaseModel):
@@ -91,18 +88,14 @@ class Client(BaseModel):
     linked_clients: Optional[List[LinkedClient]] = None
     custom_fields: Optional[List[CustomField]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Tag(BaseModel):
     client_id: Optional[int] = None
     tag: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Diagnosis(BaseModel):
@@ -112,6 +105,4 @@ class Diagnosis(BaseModel):
     end_date: Optional[datetime] = None
     note_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_pascal
+
+from common.models.aliases import PASCAL_CONFIG
 
 
 class Role(str, Enum):
@@ -24,6 +25,4 @@ class Practitioner(BaseModel):
     is_inactive: Optional[bool] = None
     additional_practitioner_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
@@ -2,7 +2,8 @@ from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_pascal
+
+from common.models.aliases import PASCAL_CONFIG
 
 
 class Status(str, Enum):
@@ -35,9 +36,7 @@ class Intake(BaseModel):
     external_client_id: Optional[str] = None
     consent_forms: Optional[List[ConsentForm]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class Questionnaire(BaseModel):
@@ -46,9 +45,7 @@ class Questionnaire(BaseModel):
     archived: Optional[bool] = None
     anonymous: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class SendQuestionnaireRequest(BaseModel):
@@ -60,9 +57,7 @@ class SendQuestionnaireRequest(BaseModel):
     practitioner_id: Optional[str] = None
     external_client_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class DeliveryMethod(str, Enum):
@@ -74,9 +69,7 @@ class ResendIntakeRequest(BaseModel):
     intake_id: Optional[str] = None
     delivery_method: Optional[DeliveryMethod] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class EventType(str, Enum):
@@ -91,6 +84,4 @@ class IntakeWebhook(BaseModel):
     external_client_id: Optional[str] = None
     practice_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
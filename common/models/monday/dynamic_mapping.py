@@ -1,7 +1,8 @@
 from typing import List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class DynamicFieldOption(BaseModel):
@@ -10,6 +11,4 @@ class DynamicFieldOption(BaseModel):
     outbound_type: str
     inbound_types: List[str]
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
@@ -1,7 +1,8 @@
 from typing import Optional, List, Any
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class FieldOption(BaseModel):
@@ -18,9 +19,7 @@ class OptionsResponse(BaseModel):
     is_paginated: Optional[bool] = None
     next_page_request_data: Optional[Page] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class Reference(BaseModel):
@@ -44,9 +43,7 @@ class OptionsRequest(BaseModel):
     integration_id: Optional[int] = None
     page_request_data: Optional[Page] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class Payload(BaseModel):
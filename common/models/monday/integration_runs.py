@@ -1,14 +1,9 @@
-from typing import Any
 from typing import Optional
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
 
-
-class Reference(BaseModel):
-    title: Optional[str] = None
-    value: Optional[Any] = None
-    invalid: Optional[bool] = None
+from common.models.aliases import CAMEL_CONFIG
+from common.models.monday.monday_integrations import Reference
 
 
 class InboundFieldValues(BaseModel):
@@ -26,9 +21,7 @@ class InboundFieldValues(BaseModel):
     workspace: Optional[Reference] = None
     item_values: Optional[dict] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class IntegrationRun(BaseModel):
@@ -39,18 +32,14 @@ class IntegrationRun(BaseModel):
     account_id: Optional[int] = None
     user_id: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class RuntimeMetadata(BaseModel):
     action_uuid: Optional[str] = None
     trigger_uuid: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ActionPayload(BaseModel):
@@ -5,7 +5,8 @@ from typing import Optional
 
 from firedantic import Model
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class Reference(BaseModel):
@@ -44,9 +45,7 @@ class InputFields(BaseModel):
     scheduler_config: Optional[SchedulerConfig] = None
     status_column_value: Optional[StatusColumnValue] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class MondayIntegration(Model):
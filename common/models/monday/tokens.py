@@ -1,7 +1,8 @@
 from typing import Optional
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class AuthToken(BaseModel):
@@ -16,6 +17,4 @@ class AuthToken(BaseModel):
     integration_id: Optional[int] = None
     back_to_url: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
@@ -2,8 +2,8 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, field_serializer
-from pydantic.alias_generators import to_camel
 
+from common.models.aliases import CAMEL_CONFIG
 from common.models.monday.monday_integrations import InputFields
 
 
@@ -36,9 +36,7 @@ class MondayWebhookEvent(BaseModel):
     def serialize_trigger_time(self, trigger_time: datetime, _info):
         return trigger_time.isoformat()
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class MondayWebhook(BaseModel):
@@ -49,9 +47,7 @@ class MondayWebhook(BaseModel):
 class BlockMetadata(BaseModel):
     should_calculate_dynamic_mapping: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class SubscriptionRequest(BaseModel):
@@ -62,9 +58,7 @@ class SubscriptionRequest(BaseModel):
     input_fields: Optional[InputFields] = None
     block_metadata: Optional[BlockMetadata] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class SubscriptionRequestPayload(BaseModel):
@@ -74,9 +68,7 @@ class SubscriptionRequestPayload(BaseModel):
 class UnsubscribeRequest(BaseModel):
     webhook_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class UnsubscribeRequestPayload(BaseModel):
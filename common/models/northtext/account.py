@@ -1,7 +1,8 @@
 from datetime import datetime
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class Account(BaseModel):
@@ -18,9 +19,7 @@ class Account(BaseModel):
     active: bool
     default_system_number: int
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class AccountResponse(BaseModel):
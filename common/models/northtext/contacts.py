@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class Gender(int, Enum):
@@ -26,9 +27,7 @@ class ContactCreateRequest(BaseModel):
     is_subscriber: Optional[bool] = None
     groups: Optional[List[int]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class OptOutStatus(str, Enum):
@@ -58,9 +57,7 @@ class Contact(BaseModel):
     subscribed_date: Optional[datetime] = None
     unsubscribed_date: Optional[datetime] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class ContactResponse(BaseModel):
@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel, field_serializer
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class Tag(BaseModel):
@@ -11,9 +12,7 @@ class Tag(BaseModel):
     value: str
     is_empty: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class MessageSendRequest(BaseModel):
@@ -32,9 +31,7 @@ class MessageSendRequest(BaseModel):
     def serialize_dt(self, dt: datetime, _info):
         return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class MessageType(int, Enum):
@@ -63,9 +60,7 @@ class Message(BaseModel):
     user_id: Optional[str] = None
     tags: Optional[List[Tag]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class MessageResponse(BaseModel):
@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Optional, List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_camel
+
+from common.models.aliases import CAMEL_CONFIG
 
 
 class User(BaseModel):
@@ -21,9 +22,7 @@ class User(BaseModel):
     creation_date: Optional[datetime] = None
     last_update: Optional[datetime] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_camel
+    model_config = CAMEL_CONFIG
 
 
 class UsersResponse(BaseModel):
@@ -3,8 +3,8 @@ from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel
-from pydantic.alias_generators import to_pascal
 
+from common.models.aliases import PASCAL_CONFIG
 from common.models.northtext.messages import MessageType, MessageStatus
 
 
@@ -13,9 +13,7 @@ class Tag(BaseModel):
     value: str
     is_empty: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class IncomingMessage(BaseModel):
@@ -28,9 +26,7 @@ class IncomingMessage(BaseModel):
     body: Optional[str] = None
     attachment_url: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class DeliveryReceipt(BaseModel):
@@ -48,9 +44,7 @@ class DeliveryReceipt(BaseModel):
     user_id: Optional[str] = None
     tags: Optional[List[Tag]] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class OptInOptOut(int, Enum):
@@ -67,9 +61,7 @@ class SubscriptionStatus(BaseModel):
     subscription_status: Optional[OptInOptOut] = None
     user_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
-        alias_generator = to_pascal
+    model_config = PASCAL_CONFIG
 
 
 class WebhookEventType(int, Enum):
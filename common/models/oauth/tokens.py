@@ -1,7 +1,7 @@
-from datetime import datetime
+import time
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Token(BaseModel):
@@ -11,7 +11,7 @@ class Token(BaseModel):
     token_type: Optional[str] = None
     id_token: Optional[str] = None
     private_token: Optional[str] = None
-    expires_at: int = int(datetime.now().timestamp()) + expires_in
+    expires_at: int = Field(default_factory=lambda: int(time.time()))
 
 
 class AccountToken(BaseModel):
@@ -2,11 +2,12 @@ from datetime import datetime, timedelta
 from typing import Optional, Any
 
 from firedantic import Model
+from pydantic import Field
 
 
 class SnowflakeObject(Model):
     __collection__ = "apps/snowflake/snowflake_objects"
     __ttl_field__ = "timestamp"
 
-    timestamp: Optional[datetime] = datetime.now() + timedelta(minutes=10)
+    timestamp: Optional[datetime] = Field(default_factory=lambda: datetime.now() + timedelta(minutes=10))
     content: Optional[Any] = None
@@ -1,7 +1,7 @@
-from datetime import datetime
+import time
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Token(BaseModel):
@@ -9,7 +9,7 @@ class Token(BaseModel):
     expires_in: int = 0
     refresh_token: Optional[str] = None
     token_type: Optional[str] = None
-    expires_at: int = int(datetime.now().timestamp()) + expires_in
+    expires_at: int = Field(default_factory=lambda: int(time.time()))
     username: Optional[str] = None
 
 
@@ -1,31 +1,89 @@
 import functools
+import inspect
 import json
-from time import time
+from time import perf_counter
 
-from google.cloud import logging
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from common.core.cloud_logging import BackgroundLogger, get_logging_client
+
+# callable attribute types that are never wrapped with method_logger
+UNLOGGED_TYPES = frozenset([bool, type, str, int])
+SIZED_TYPES = (str, bytes, list, tuple, set, frozenset, dict)
+MAX_LOGGED_INPUT_LENGTH = 3000
+MAX_LOGGED_OUTPUT_LENGTH = 1000
+
+
+def exceeds_log_length(value, max_length: int) -> bool:
+    # every item of a builtin container adds at least one character to its str(),
+    # so large values can be rejected without stringifying them
+    return isinstance(value, SIZED_TYPES) and len(value) > max_length
 
 
 def method_logger(f, logger, private_output: bool = False, exclude_inputs: list = None, exclude_outputs: list = None):
-    @functools.wraps(f)
-    def wrapper(*args, **kwargs):
-        if not exclude_inputs or f.__name__ not in exclude_inputs:
+    # resolved once per wrapper; BaseService reuses wrappers across calls
+    name = f.__name__
+    log_inputs = not exclude_inputs or name not in exclude_inputs
+    log_outputs = not exclude_outputs or name not in exclude_outputs
+
+    def log_inputs_of(args, kwargs) -> None:
+        if (
+            any(exceeds_log_length(arg, MAX_LOGGED_INPUT_LENGTH) for arg in args)
+            or any(exceeds_log_length(arg, MAX_LOGGED_INPUT_LENGTH) for arg in kwargs.values())
+        ):
+            request_str = '***Input too long to log***'
+        else:
             args_str = str(args)
             kwargs_str = str(kwargs)
             request_str = f"{args_str}, {kwargs_str}"
-            if len(request_str) > 3000:
+            if len(request_str) > MAX_LOGGED_INPUT_LENGTH:
                 request_str = '***Input too long to log***'
-            logger.log_text(f"Calling {f.__name__} with args: {request_str}")
-        t1 = time()
-        result = f(*args, **kwargs)
-        t2 = time()
-        if not exclude_outputs or f.__name__ not in exclude_outputs:
+        logger.log_text(f"Calling {name} with args: {request_str}")
+
+    def log_output_of(result, elapsed: float) -> None:
+        # don't stringify results that are going to be masked anyway
+        if private_output:
+            result_str = '***MASKED***'
+        elif exceeds_log_length(result, MAX_LOGGED_OUTPUT_LENGTH):
+            result_str = '"***Output too long to log***"'
+        else:
             result_str = str(result)
-            if len(result_str) > 1000:
-                result_str = '***Output too long to log***'
-            logger.log_text(
-                f"Function {f.__name__!r} executed in {(t2 - t1):.4f}s. Received "
-                f"{f.__name__} result: {json.dumps(result_str) if not private_output else '***MASKED***'}"
-            )
+            if len(result_str) > MAX_LOGGED_OUTPUT_LENGTH:
+                result_str = '"***Output too long to log***"'
+            else:
+                result_str = orjson.dumps(result_str).decode() if orjson else json.dumps(result_str)
+        logger.log_text(
+            f"Function {name!r} executed in {elapsed:.4f}s. Received "
+            f"{name} result: {result_str}"
+        )
+
+    if inspect.iscoroutinefunction(f):
+        # time and log the awaited result rather than the coroutine object
+        @functools.wraps(f)
+        async def async_wrapper(*args, **kwargs):
+            if log_inputs:
+                log_inputs_of(args, kwargs)
+            t1 = perf_counter()
+            result = await f(*args, **kwargs)
+            t2 = perf_counter()
+            if log_outputs:
+                log_output_of(result, t2 - t1)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if log_inputs:
+            log_inputs_of(args, kwargs)
+        t1 = perf_counter()
+        result = f(*args, **kwargs)
+        t2 = perf_counter()
+        if log_outputs:
+            log_output_of(result, t2 - t1)
         return result
 
     return wrapper
@@ -43,19 +101,24 @@ class BaseService:
         self.private_output = private_output
         self.exclude_inputs = exclude_inputs
         self.exclude_outputs = exclude_outputs
-        logging_client = logging.Client()
-        self.logger = logging_client.logger(log_name)
+        self.logger = BackgroundLogger(get_logging_client().logger(log_name))
 
     def __getattribute__(self, item):
         value = object.__getattribute__(self, item)
-        if type(value) not in [bool, type, str, int] and callable(value):
+        if type(value) not in UNLOGGED_TYPES and callable(value):
+            # reuse the logging wrapper built on a previous access of the same method
+            logged_methods = object.__getattribute__(self, '__dict__').setdefault('_logged_methods', {})
+            logged_method = logged_methods.get(item)
+            if logged_method is not None and logged_method.__wrapped__ == value:
+                return logged_method
             decorator = method_logger
-            return decorator(
+            logged_method = logged_methods[item] = decorator(
                 value,
                 logger=self.logger,
                 private_output=self.private_output,
                 exclude_inputs=self.exclude_inputs,
                 exclude_outputs=self.exclude_outputs
             )
+            return logged_method
 
         return value
@@ -1,13 +1,22 @@
+import asyncio
 import json
-from datetime import datetime, timedelta, timezone
+import time
 from typing import List
 
 from google.cloud import tasks_v2
 from google.cloud.tasks_v2 import Task
 from google.protobuf import timestamp_pb2
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from common.core.utils import is_valid_url
 from common.services.base import BaseService
 
+ENQUEUE_MANY_CONCURRENCY = 16
+
 
 class CloudTasksService(BaseService):
 
@@ -24,50 +33,144 @@ class CloudTasksService(BaseService):
         self.location = location
         self.base_url = base_url
         self.service_account_email = service_account_email
-        super().__init__(log_name='cloud_tasks.service')
+        self.queue_paths = {}
+        # shared by every task that uses the default service account and audience
+        self.default_oidc_token = {
+            'service_account_email': service_account_email,
+            'audience': base_url.strip('/')
+        }
+        super().__init__(
+            log_name='cloud_tasks.service',
+            exclude_inputs=[
+                'build_task_request',
+                'encode_payload'
+            ],
+            exclude_outputs=[
+                'build_task_request',
+                'encode_payload'
+            ]
+        )
 
     def enqueue(
         self,
         queue: str,
         handler_uri: str,
-        payload: [dict | List[dict]] = None,
+        payload: [dict | List[dict] | bytes] = None,
         in_seconds: int = None,
         base_url: str = None,
         service_account: str = None
     ) -> Task:
-        parent = self.cloud_tasks_client.queue_path(self.project, self.location, queue)
+        request = self.build_task_request(
+            queue=queue,
+            handler_uri=handler_uri,
+            payload=payload,
+            in_seconds=in_seconds,
+            base_url=base_url,
+            service_account=service_account
+        )
+        return self.cloud_tasks_client.create_task(request=request)
+
+    @staticmethod
+    def encode_payload(payload: [dict | List[dict] | bytes]) -> bytes:
+        # The API expects a payload of type bytes. Callers fanning the same payload out to many tasks
+        # can encode it once with this method and pass the bytes to enqueue.
+        if isinstance(payload, bytes):
+            return payload
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) if orjson else json.dumps(payload).encode()
+
+    def build_task_request(
+        self,
+        queue: str,
+        handler_uri: str,
+        payload: [dict | List[dict] | bytes] = None,
+        in_seconds: int = None,
+        base_url: str = None,
+        service_account: str = None
+    ) -> dict:
+        parent = self.queue_paths.get(queue)
+        if parent is None:
+            parent = self.queue_paths[queue] = self.cloud_tasks_client.queue_path(self.project, self.location, queue)
 
         # Construct the request body.
         base_url = base_url.strip('/') if base_url else self.base_url.strip('/')
         handler_uri = handler_uri.strip('/')
-        url = handler_uri if handler_uri.startswith('https://') else f"{base_url}/{handler_uri}"
+        url = handler_uri if is_valid_url(handler_uri) else f"{base_url}/{handler_uri}"
+        if service_account or base_url != self.default_oidc_token['audience']:
+            oidc_token = {
+                'service_account_email': service_account if service_account else self.service_account_email,
+                'audience': base_url
+            }
+        else:
+            oidc_token = self.default_oidc_token
         task = {
             'http_request': {  # Specify the type of request.
                 'http_method': tasks_v2.HttpMethod.POST,
                 'url': url,  # The full url path that the task will be sent to.
-                'oidc_token': {
-                    'service_account_email': service_account if service_account else self.service_account_email,
-                    'audience': base_url
-                },
+                'oidc_token': oidc_token,
             }
         }
 
         if payload is not None:
-            # The API expects a payload of type bytes.
-            converted_payload = json.dumps(payload).encode()
-
             # Add the payload to the request.
-            task['http_request']['body'] = converted_payload
+            task['http_request']['body'] = self.encode_payload(payload)
 
         if in_seconds is not None:
-            # Convert "seconds from now" into a rfc3339 datetime string.
-            d = datetime.now(tz=timezone.utc) + timedelta(
-                seconds=in_seconds
-            )
-            timestamp = timestamp_pb2.Timestamp()
-            timestamp.FromDatetime(d)
+            # Convert "seconds from now" into an epoch timestamp.
+            scheduled_at = time.time() + in_seconds
+            seconds = int(scheduled_at)
+            timestamp = timestamp_pb2.Timestamp(seconds=seconds, nanos=int((scheduled_at - seconds) * 1e9))
 
             # Add the timestamp to the tasks.
             task['schedule_time'] = timestamp
-        request = {'parent': parent, 'task': task}
-        return self.cloud_tasks_client.create_task(request=request)
+        return {'parent': parent, 'task': task}
+
+
+class AsyncCloudTasksService(CloudTasksService):
+
+    def __init__(
+        self,
+        cloud_tasks_client: tasks_v2.CloudTasksAsyncClient,
+        project: str,
+        location: str,
+        base_url: str,
+        service_account_email: str
+    ) -> None:
+        super().__init__(
+            cloud_tasks_client=cloud_tasks_client,
+            project=project,
+            location=location,
+            base_url=base_url,
+            service_account_email=service_account_email
+        )
+
+    async def enqueue(
+        self,
+        queue: str,
+        handler_uri: str,
+        payload: [dict | List[dict] | bytes] = None,
+        in_seconds: int = None,
+        base_url: str = None,
+        service_account: str = None
+    ) -> Task:
+        request = self.build_task_request(
+            queue=queue,
+            handler_uri=handler_uri,
+            payload=payload,
+            in_seconds=in_seconds,
+            base_url=base_url,
+            service_account=service_account
+        )
+        return await self.cloud_tasks_client.create_task(request=request)
+
+    async def enqueue_many(self, tasks: List[dict]) -> List[Task]:
+        # each item holds the keyword arguments of a single enqueue call. The tasks are created straight
+        # through the client so the batch is logged once, with a bounded number of requests in flight.
+        cloud_tasks_client = self.cloud_tasks_client
+        semaphore = asyncio.Semaphore(ENQUEUE_MANY_CONCURRENCY)
+        requests = [self.build_task_request(**task) for task in tasks]
+
+        async def create_task(request: dict) -> Task:
+            async with semaphore:
+                return await cloud_tasks_client.create_task(request=request)
+
+        return await asyncio.gather(*(create_task(request) for request in requests))
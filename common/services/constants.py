@@ -1,4 +1,4 @@
-BASE_WORKFLOW_ACTION_OBJECTS = [
+BASE_WORKFLOW_ACTION_OBJECTS = (
     {
         "label": "Company",
         "value": "COMPANY"
@@ -27,16 +27,16 @@ BASE_WORKFLOW_ACTION_OBJECTS = [
         "label": "Ticket",
         "value": "TICKET"
     }
-]
+)
 
-BASE_OBJECTS = [
+BASE_OBJECTS = (
     "0-1",  # contact
     "0-2",  # company
     "0-3",  # deal
     "0-5"  # ticket
-]
+)
 
-ALLOWABLE_SNOWFLAKE_PRIMARY_KEY_COLUMNS = [
+ALLOWABLE_SNOWFLAKE_PRIMARY_KEY_COLUMNS = frozenset([
     'name',
     'color',
     'date',
@@ -49,16 +49,16 @@ ALLOWABLE_SNOWFLAKE_PRIMARY_KEY_COLUMNS = [
     #   'autonumber', not valid for now
     'email',
     'link'
-]
+])
 
-UNSUPPORTED_MONDAY_COLUMN_TYPES = [
+UNSUPPORTED_MONDAY_COLUMN_TYPES = frozenset([
     'formula',
     'auto_number',
     'progress',
     'button',
-]
+])
 
-SNOWFLAKE_RESERVED_KEYWORDS = [
+SNOWFLAKE_RESERVED_KEYWORDS = frozenset([
     'ACCOUNT',
     'ALL',
     'ALTER',
@@ -150,4 +150,4 @@ SNOWFLAKE_RESERVED_KEYWORDS = [
     'WHENEVER',
     'WHERE',
     'WITH'
-]
+])
@@ -1,9 +1,11 @@
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, List, Type
 
 from firedantic import ModelNotFoundError, configure
 from google.cloud import firestore
 from google.cloud.firestore_v1 import FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
 from hubspot.crm.schemas import ObjectSchema
 
 from common.core.utils import timed_lru_cache
@@ -111,7 +113,12 @@ class FirestoreService(BaseService):
         Connection.__collection__ = f'installations/{installation_id}/connections'
         installation = Installation.get_by_id(installation_id)
         connection_model: Type[Connection] = Connection.model_for(installation)
-        new_connection = connection_model(**connection.model_dump(exclude_unset=True))
+        # connection is already validated, so its set fields are copied over instead of dumped and re-validated
+        fields_set = connection.model_fields_set
+        new_connection = connection_model.model_construct(
+            _fields_set=fields_set,
+            **{field: getattr(connection, field) for field in fields_set}
+        )
         new_connection.save(exclude_unset=True)
         return new_connection
 
@@ -158,20 +165,17 @@ class FirestoreService(BaseService):
         ).document(
             app_name
         )
-        if not app_doc.get().exists:
-            app_doc.set(
-                {'created': datetime.now()}
-            )
-
         account_doc = app_doc.collection(
             'accounts'
         ).document(
             str(account_id)
         )
-        if not account_doc.get().exists:
-            account_doc.set(
-                {'created': datetime.now()}
-            )
+        # both existence checks are answered by a single BatchGetDocuments call
+        for doc in self.firestore_client.get_all([app_doc, account_doc]):
+            if not doc.exists:
+                doc.reference.set(
+                    {'created': datetime.now()}
+                )
         return account_doc
 
     @timed_lru_cache(seconds=180)
@@ -186,11 +190,12 @@ class FirestoreService(BaseService):
         ).get()
         if not connection_doc.exists:
             raise ConnectionNotFoundException(message=f"{app_name} connection for account id {account_id} not found.")
-        return Token(**connection_doc.to_dict())
+        # the document is written by set_account_connection, so it is trusted and not re-validated
+        return Token.model_construct(**connection_doc.to_dict())
 
     def set_account_connection(self, app_name: str, account_id: [int | str], token: dict):
         if 'expires_in' in token:
-            token['expires_at'] = int((datetime.now() + timedelta(seconds=token['expires_in'] - 60)).timestamp())
+            token['expires_at'] = int(time.time()) + token['expires_in'] - 60
         connection_doc = self.get_account_doc(
             app_name=app_name,
             account_id=account_id
@@ -199,7 +204,8 @@ class FirestoreService(BaseService):
         ).document(
             'connection'
         )
-        connection_doc.update(token) if connection_doc.get().exists else connection_doc.set(document_data=token)
+        # merging the given fields creates the document if needed and otherwise behaves like update(), in one RPC
+        connection_doc.set(document_data=token, merge=list(token))
 
     def get_object_schema(self, app_name: str, account_id: Any, object_type: str):
         objects_doc = self.get_account_doc(
@@ -236,15 +242,16 @@ class FirestoreService(BaseService):
         doc = objects_doc.collection(
             object_type
         ).document('schema')
-        doc_data = dict() if not doc.get().exists else doc.get().to_dict()
-        doc.set(document_data=doc_data | object_schema.to_dict())
+        doc_data = object_schema.to_dict()
+        doc.set(document_data=doc_data, merge=list(doc_data))
 
     def get_app_account_ids(self, app_name: str):
         collection = self.firestore_client.collection('apps').document(
             document_id=app_name
         ).collection('accounts')
 
-        return [account_doc.id for account_doc in collection.stream()]
+        # only the document names are streamed back, not every account's fields
+        return [account_doc.id for account_doc in collection.select([FieldPath.document_id()]).stream()]
 
     def get_app_account_field(self, app_name: str, account_id: Any, field_name: str):
         doc = self.get_account_doc(
@@ -562,10 +569,7 @@ class FirestoreService(BaseService):
                 enrollment_doc = enrollments_collection.document(
                     enrollment_id
                 )
-                if enrollment_doc.get().exists:
-                    batch.update(enrollment_doc, merge_data)
-                else:
-                    batch.set(enrollment_doc, merge_data)
+                batch.set(enrollment_doc, merge_data, merge=list(merge_data))
             batch.commit()
 
     def get_bulk_enrollments(
@@ -574,17 +578,12 @@ class FirestoreService(BaseService):
         portal_id: Any,
         function_name: str
     ):
-        return self.get_account_doc(
+        return self.get_bulk_enrollments_by_field(
             app_name=app_name,
-            account_id=portal_id
-        ).collection(
-            f'{function_name}_enrollments'
-        ).where(
-            filter=FieldFilter(
-                field_path="completed",
-                op_string="==",
-                value=False
-            )
+            portal_id=portal_id,
+            function_name=function_name,
+            field_name='completed',
+            field_value=False
         )
 
     def get_bulk_enrollments_by_field(
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import cached_property
 from typing import Any, List, Union
@@ -27,12 +28,12 @@ from common.models.hubspot.settings import HubSpotAccountDetails
 from common.models.hubspot.timeline_events import TimelineEvent
 from common.models.hubspot.workflow_actions import (
     WorkflowFieldOption, WorkflowOptionsResponse, HubSpotWorkflowException, ErrorCode, ExecutionState,
-    HubSpotWorkflowActionCallbackBatchModel,
-    WorkflowActionCallback, ActionOutputFields
+    ActionOutputFields, CALLBACK_BATCH_MAX_INPUTS
 )
 from common.services import constants
 from common.services.base import BaseService
 
+CALLBACK_BATCH_CONCURRENCY = 4
 MULTI_URL_REGEX = r'((https?):((//)|(\\\\))+([\w\d:#@%/;$~_?\+-=\\\.&](#!)?)*)'
 
 
@@ -92,7 +93,7 @@ class HubSpotService(BaseService):
             users_response = self.hubspot_client.settings.users.users_api.get_page(
                 after=users_response.paging.next.after
             )
-            users.append(users_response.results)
+            users.extend(users_response.results)
         return users
 
     def get_owner_by_id(self, owner_id, id_property: str = 'id'):
@@ -106,7 +107,7 @@ class HubSpotService(BaseService):
                 after=owners_response.paging.next.after,
                 archived=archived
             )
-            owners.append(owners_response.results)
+            owners.extend(owners_response.results)
         if archived:
             users_by_email = {user.email: user for user in self.get_users()}
             for owner in owners:
@@ -207,7 +208,7 @@ class HubSpotService(BaseService):
 
     @cached_property
     def get_objects_as_workflow_options(self):
-        objects = constants.BASE_WORKFLOW_ACTION_OBJECTS
+        objects = list(constants.BASE_WORKFLOW_ACTION_OBJECTS)
         if 'crm.schemas.custom.read' in self.get_token_details().scopes:
             for custom_object in self.hubspot_client.crm.schemas.core_api.get_all().results:
                 objects.append(
@@ -347,6 +348,7 @@ class HubSpotService(BaseService):
                 'label': str(option[option_label_key]),
                 'value': str(option[option_value_key])
             }
+        remove_options = set(remove_options) if remove_options else None
         prop = self.get_property(object_type=object_type, property_name=property_name).to_dict()
         new_option_map = {o[option_value_key]: parse_option(i, o) for i, o in enumerate(new_options)}
         for o in prop['options']:
@@ -1151,22 +1153,28 @@ class HubSpotService(BaseService):
         callback_ids: List[str],
         output_data: Any = None
     ):
-        chunk_size = 100
+        chunk_size = CALLBACK_BATCH_MAX_INPUTS
+        output_fields = {
+            "hs_execution_state": ExecutionState.SUCCESS
+        }
+        if type(output_data) == dict:
+            output_fields |= output_data
+        # every callback gets the same output, so validate and dump it once instead of per callback
+        output_fields = ActionOutputFields(**output_fields).model_dump(
+            by_alias=True,
+            exclude_none=True,
+            exclude_unset=True
+        )
         while callback_ids:
             chunk, callback_ids = callback_ids[:chunk_size], callback_ids[chunk_size:]
-            output_fields = {
-                "hs_execution_state": ExecutionState.SUCCESS
-            }
-            if type(output_data) == dict:
-                output_fields |= output_data
-            data = HubSpotWorkflowActionCallbackBatchModel(
-                inputs=[
-                    WorkflowActionCallback(
-                        output_fields=ActionOutputFields(**output_fields),
-                        callback_id=callback_id
-                    ) for callback_id in set(chunk)
+            data = {
+                'inputs': [
+                    {
+                        'output_fields': output_fields,
+                        'callbackId': callback_id
+                    } for callback_id in set(chunk)
                 ]
-            ).model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            }
             self.hubspot_client.automation.actions.callbacks_api.complete_batch(
                 batch_input_callback_completion_batch_request=data
             )
@@ -1175,25 +1183,33 @@ class HubSpotService(BaseService):
         self,
         callbacks: List[dict]
     ):
-        chunk_size = 100
-        while callbacks:
-            chunk, callbacks = callbacks[:chunk_size], callbacks[chunk_size:]
-            try:
-                self.hubspot_client.automation.actions.callbacks_api.complete_batch(
-                    batch_input_callback_completion_batch_request={
-                        'inputs': chunk
-                    }
-                )
-            except ApiException as e:
-                if 'CALLBACK_NOT_FOUND' not in str(e):
-                    raise e
-                chunk = [c for c in chunk if c['callbackId'] not in str(e)]
-                self.logger.log_text(f"Excluding invalid callbacks")
-                self.hubspot_client.automation.actions.callbacks_api.complete_batch(
-                    batch_input_callback_completion_batch_request={
-                        'inputs': chunk
-                    }
-                )
+        chunks = [
+            callbacks[i:i + CALLBACK_BATCH_MAX_INPUTS] for i in range(0, len(callbacks), CALLBACK_BATCH_MAX_INPUTS)
+        ]
+        if len(chunks) == 1:
+            self._complete_callback_batch(chunks[0])
+            return
+        # the batches are independent, so a few are sent at once instead of waiting on each round trip
+        with ThreadPoolExecutor(max_workers=CALLBACK_BATCH_CONCURRENCY) as executor:
+            list(executor.map(self._complete_callback_batch, chunks))
+
+    def _complete_callback_batch(self, chunk: List[dict]):
+        try:
+            self.hubspot_client.automation.actions.callbacks_api.complete_batch(
+                batch_input_callback_completion_batch_request={
+                    'inputs': chunk
+                }
+            )
+        except ApiException as e:
+            if 'CALLBACK_NOT_FOUND' not in str(e):
+                raise e
+            chunk = [c for c in chunk if c['callbackId'] not in str(e)]
+            self.logger.log_text(f"Excluding invalid callbacks")
+            self.hubspot_client.automation.actions.callbacks_api.complete_batch(
+                batch_input_callback_completion_batch_request={
+                    'inputs': chunk
+                }
+            )
 
     def get_products(self, after: str = None, limit: int = 100):
         return self.hubspot_client.crm.products.basic_api.get_page(limit=limit, after=after)
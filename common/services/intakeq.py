@@ -1,8 +1,10 @@
 import time
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Any, List
 
 import requests
+from pydantic import TypeAdapter
 
 from common.models.intakeq.appointments import (
     Status, Appointment, AppointmentSettings, CreateAppointmentRequest,
@@ -14,6 +16,11 @@ from common.models.intakeq.questionnaires import Intake, Questionnaire, ResendIn
 from common.services.base import BaseService
 
 
+@lru_cache(maxsize=None)
+def get_type_adapter(response_model) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
 class IntakeQService(BaseService):
     headers = {"Content-Type": "application/json", "Accept": "application/json"}
     base_url = 'https://intakeq.com/api/v1'
@@ -34,10 +41,13 @@ class IntakeQService(BaseService):
         endpoint: str,
         params: dict = None,
         data: str = None,
-        json: [dict | list] = None
-    ) -> dict:
-        r = getattr(requests, method.lower())(
-            url=f"{self.base_url}/{endpoint.strip('/')}",
+        json: [dict | list] = None,
+        response_model: Any = None
+    ) -> Any:
+        url = f"{self.base_url}/{endpoint.strip('/')}"
+        r = requests.request(
+            method=method,
+            url=url,
             params=params,
             data=data,
             json=json,
@@ -46,8 +56,9 @@ class IntakeQService(BaseService):
         # rate limiting
         while r.status_code == 429:
             time.sleep(1)
-            r = getattr(requests, method.lower())(
-                url=f"{self.base_url}/{endpoint.strip('/')}",
+            r = requests.request(
+                method=method,
+                url=url,
                 params=params,
                 data=data,
                 json=json,
@@ -55,6 +66,9 @@ class IntakeQService(BaseService):
             )
         if r.status_code >= 400:
             raise Exception(f"Error {r.status_code} {r.text}")
+        if response_model is not None:
+            # the body is parsed straight into the models, without building the intermediate dicts
+            return get_type_adapter(response_model).validate_json(r.content)
         return r.json()
 
     def get_clients(
@@ -82,12 +96,12 @@ class IntakeQService(BaseService):
                      'deletedOnly': deleted_only
                  } | kwargs
         params = {k: v for k, v in params.items() if v is not None}
-        response = self.api_call(
+        return self.api_call(
             method='get',
             endpoint=f"clients",
-            params=params
+            params=params,
+            response_model=List[Client]
         )
-        return [Client.model_validate(client) for client in response]
 
     def add_tag_to_client(self, tag: Tag) -> None:
         self.api_call(
@@ -104,11 +118,11 @@ class IntakeQService(BaseService):
         )
 
     def get_client_diagnoses(self, client_id: int) -> List[Diagnosis]:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"client/{client_id}/diagnoses"
+            endpoint=f"client/{client_id}/diagnoses",
+            response_model=List[Diagnosis]
         )
-        return [Diagnosis.model_validate(diagnosis) for diagnosis in response]
 
     def get_appointments(
         self,
@@ -132,62 +146,62 @@ class IntakeQService(BaseService):
             'deletedOnly': deleted_only
         }
         params = {k: v for k, v in params.items() if v is not None}
-        response = self.api_call(
+        return self.api_call(
             method='get',
             endpoint=f"appointments",
-            params=params
+            params=params,
+            response_model=List[Appointment]
         )
-        return [Appointment.model_validate(appointment) for appointment in response]
 
     def get_appointment(
         self,
         appointment_id: str
     ) -> Appointment:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"appointments/{appointment_id}"
+            endpoint=f"appointments/{appointment_id}",
+            response_model=Appointment
         )
-        return Appointment.model_validate(response)
 
     def get_appointment_settings(self) -> AppointmentSettings:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"appointments/settings"
+            endpoint=f"appointments/settings",
+            response_model=AppointmentSettings
         )
-        return AppointmentSettings.model_validate(response)
 
     def create_appointment(
         self,
         appointment: CreateAppointmentRequest
     ) -> Appointment:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"appointments",
-            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=Appointment
         )
-        return Appointment.model_validate(response)
 
     def update_appointment(
         self,
         appointment: UpdateAppointmentRequest
     ) -> Appointment:
-        response = self.api_call(
+        return self.api_call(
             method='put',
             endpoint=f"appointments",
-            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=Appointment
         )
-        return Appointment.model_validate(response)
 
     def cancel_appointment(
         self,
         appointment: CancelAppointmentRequest
     ) -> Appointment:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"appointments/cancellation",
-            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=appointment.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=Appointment
         )
-        return Appointment.model_validate(response)
 
     def get_intake_forms(
         self,
@@ -213,59 +227,59 @@ class IntakeQService(BaseService):
             'deletedOnly': deleted_only
         }
         params = {k: v for k, v in params.items() if v is not None}
-        response = self.api_call(
+        return self.api_call(
             method='get',
             endpoint=f"intakes/summary",
-            params=params
+            params=params,
+            response_model=List[Intake]
         )
-        return [Intake.model_validate(intake) for intake in response]
 
     def get_intake(
         self,
         intake_id: str
     ) -> Intake:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"intakes/{intake_id}"
+            endpoint=f"intakes/{intake_id}",
+            response_model=Intake
         )
-        return Intake.model_validate(response)
 
     def get_questionnaires(
         self
     ) -> List[Questionnaire]:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"questionnaires"
+            endpoint=f"questionnaires",
+            response_model=List[Questionnaire]
         )
-        return [Questionnaire.model_validate(questionnaire) for questionnaire in response]
 
     def get_practitioners(
         self
     ) -> List[Practitioner]:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"practitioners"
+            endpoint=f"practitioners",
+            response_model=List[Practitioner]
         )
-        return [Practitioner.model_validate(practitioner) for practitioner in response]
 
     def send_questionnaire(
         self,
         questionnaire: Questionnaire
     ) -> Intake:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"intakes/send",
-            json=questionnaire.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=questionnaire.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=Intake
         )
-        return Intake.model_validate(response)
 
     def resend_questionnaire(
         self,
         resend_intake_request: ResendIntakeRequest
     ) -> Intake:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"intakes/resend",
-            json=resend_intake_request.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=resend_intake_request.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=Intake
         )
-        return Intake.model_validate(response)
@@ -22,7 +22,11 @@ class MetadataService:
         self.headers = {
             "Metadata-Flavor": "Google"
         }
-        self.run_client = run_v2.ServicesClient()
+
+    @cached_property
+    def run_client(self):
+        # only list_services needs the Cloud Run API, most instances never touch it
+        return run_v2.ServicesClient()
 
     @cached_property
     def project_id(self):
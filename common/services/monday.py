@@ -382,7 +382,8 @@ class MondayService(BaseService):
             else:
                 column['value'] = 0
         elif column['type'] == 'checkbox':
-            column['value'] = str(column['value']['checked']) == 'true'
+            # monday sends "true" as a string, but a decoded JSON boolean is accepted too
+            column['value'] = column['value']['checked'] in (True, 'true')
         elif column['type'] == 'date':
             if 'time' in column['value'] and column['value']['time']:
                 date_time_str = f"{column['value']['date']} {column['value']['time']}"
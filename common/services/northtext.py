@@ -1,8 +1,9 @@
 import time
 from datetime import datetime
-from typing import List
+from typing import Any, List, Type
 
 import requests
+from pydantic import BaseModel
 
 from common.models.northtext.account import AccountResponse
 from common.models.northtext.contacts import ContactsResponse, ContactCreateRequest, Contact, ContactResponse
@@ -38,9 +39,18 @@ class NorthTextService(BaseService):
             raise Exception('An access token must be provided')
         super().__init__(log_name='northtext.service')
 
-    def api_call(self, method: str, endpoint: str, data: str = None, json: [dict | list] = None) -> dict:
-        r = getattr(requests, method.lower())(
-            url=f"{self.base_url}/{endpoint.strip('/')}",
+    def api_call(
+        self,
+        method: str,
+        endpoint: str,
+        data: str = None,
+        json: [dict | list] = None,
+        response_model: Type[BaseModel] = None
+    ) -> Any:
+        url = f"{self.base_url}/{endpoint.strip('/')}"
+        r = requests.request(
+            method=method,
+            url=url,
             data=data,
             json=json,
             headers=self.headers
@@ -48,41 +58,45 @@ class NorthTextService(BaseService):
         # rate limiting
         while r.status_code == 429:
             time.sleep(1)
-            r = getattr(requests, method.lower())(
-                url=f"{self.base_url}/{endpoint.strip('/')}",
+            r = requests.request(
+                method=method,
+                url=url,
                 data=data,
                 json=json,
                 headers=self.headers
             )
         if r.status_code >= 400:
-            error_response = ErrorResponse.model_validate(r.json())
+            error_response = ErrorResponse.model_validate_json(r.content)
             if error_response.description == 'Not enough available balance.':
                 raise NotEnoughFundsException(
                     message="Your account does not have enough funds to send the requested messages."
                 )
             raise Exception(f"Error {r.status_code} {r.text}")
+        if response_model is not None:
+            # the body is parsed straight into the model, without building the intermediate dicts
+            return response_model.model_validate_json(r.content)
         return r.json()
 
     def get_self(self) -> AccountResponse:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"/api/v2/account"
+            endpoint=f"/api/v2/account",
+            response_model=AccountResponse
         )
-        return AccountResponse.model_validate(response)
 
     def get_users(self) -> UsersResponse:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"/api/v2/user"
+            endpoint=f"/api/v2/user",
+            response_model=UsersResponse
         )
-        return UsersResponse.model_validate(response)
 
     def get_message(self, message_id: int) -> MessageResponse:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"/api/v2/message/{message_id}"
+            endpoint=f"/api/v2/message/{message_id}",
+            response_model=MessageResponse
         )
-        return MessageResponse.model_validate(response)
 
     def get_messages(
         self,
@@ -96,11 +110,11 @@ class NorthTextService(BaseService):
         contact_param = f"&Contact={contact_id}" if contact_id else ''
         tag_name_param = f"&TagName={tag_name}" if tag_name else ''
         tag_value_param = f"&TagValue={tag_value}" if tag_value else ''
-        response = self.api_call(
+        return self.api_call(
             'get',
-            f"/api/v2/message?Limit={limit}&Page={page}&Order={order}{contact_param}{tag_name_param}{tag_value_param}"
+            f"/api/v2/message?Limit={limit}&Page={page}&Order={order}{contact_param}{tag_name_param}{tag_value_param}",
+            response_model=MessagesResponse
         )
-        return MessagesResponse.model_validate(response)
 
     def get_all_messages_by_tag(
         self,
@@ -118,23 +132,23 @@ class NorthTextService(BaseService):
         return messages
 
     def send_message(self, message: MessageSendRequest) -> MessageResponse:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"/api/v2/message",
-            json=message.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=message.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=MessageResponse
         )
-        return MessageResponse.model_validate(response)
 
     def send_messages(
         self,
         messages: List[MessageSendRequest]
     ) -> BulkMessagesResponse:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint='/api/v2/message/bulk',
-            json=[m.model_dump(by_alias=True, exclude_unset=True, exclude_none=True) for m in messages]
+            json=[m.model_dump(by_alias=True, exclude_unset=True, exclude_none=True) for m in messages],
+            response_model=BulkMessagesResponse
         )
-        return BulkMessagesResponse.model_validate(response)
 
     def get_contacts(
         self,
@@ -146,11 +160,11 @@ class NorthTextService(BaseService):
     ) -> ContactsResponse:
         phone_param = f"&PhoneNumber={phone_number}" if phone_number else ''
         since_param = f"&lastUpdate={since}" if since else ''
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"/api/v2/contact?Limit={limit}&Page={page}&Order={order}{phone_param}{since_param}"
+            endpoint=f"/api/v2/contact?Limit={limit}&Page={page}&Order={order}{phone_param}{since_param}",
+            response_model=ContactsResponse
         )
-        return ContactsResponse.model_validate(response)
 
     def get_all_contacts(self, since: datetime = None) -> List[Contact]:
         contacts_response = self.get_contacts(since=since)
@@ -163,39 +177,39 @@ class NorthTextService(BaseService):
         return contacts
 
     def create_contact(self, contact: ContactCreateRequest) -> ContactResponse:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint=f"/api/v2/contact",
-            json=contact.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=contact.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=ContactResponse
         )
-        return ContactResponse.model_validate(response)
 
     def get_contact(self, contact_id: int) -> ContactResponse:
-        response = self.api_call(
+        return self.api_call(
             method='get',
-            endpoint=f"/api/v2/contact/{contact_id}"
+            endpoint=f"/api/v2/contact/{contact_id}",
+            response_model=ContactResponse
         )
-        return ContactResponse.model_validate(response)
 
     def update_contact(self, contact_id: int, contact: Contact) -> ContactResponse:
-        response = self.api_call(
+        return self.api_call(
             'put',
             f"/api/v2/contact/{contact_id}",
-            json=contact.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=contact.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=ContactResponse
         )
-        return ContactResponse.model_validate(response)
 
     def create_webhook(self, webhook: WebhookCreateRequest) -> WebhookResponse:
-        response = self.api_call(
+        return self.api_call(
             method='post',
             endpoint='/api/v2/webhook',
-            json=webhook.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+            json=webhook.model_dump(by_alias=True, exclude_none=True, exclude_unset=True),
+            response_model=WebhookResponse
         )
-        return WebhookResponse.model_validate(response)
 
     def delete_webhook(self, webhook_id: int) -> WebhookDeleteResponse:
-        response = self.api_call(
+        return self.api_call(
             method='delete',
-            endpoint=f'/api/v2/webhook/{webhook_id}'
+            endpoint=f'/api/v2/webhook/{webhook_id}',
+            response_model=WebhookDeleteResponse
         )
-        return WebhookDeleteResponse.model_validate(response)
@@ -0,0 +1,146 @@
+import logging
+from unittest.mock import MagicMock
+
+from common.core import cloud_logging
+
+
+def failing_cloud_logger(name: str = 'failing-log') -> MagicMock:
+    cloud_logger = MagicMock()
+    cloud_logger.name = name
+    batch = cloud_logger.batch.return_value
+    batch.logger = cloud_logger
+    batch.entries = ['entry']
+    batch.commit.side_effect = RuntimeError('quota exceeded')
+    return cloud_logger
+
+
+def test_failed_writes_are_reported_through_logging_not_stdout(caplog, capsys):
+    cloud_logger = failing_cloud_logger()
+
+    with caplog.at_level(logging.ERROR, logger=cloud_logging.__name__):
+        cloud_logging._write([(cloud_logger, 'log_text', 'hello', {})])
+
+    assert capsys.readouterr().out == ''
+    [record] = caplog.records
+    assert 'failing-log' in record.getMessage()
+    assert record.exc_info[0] is RuntimeError
+
+
+def background_logger(monkeypatch) -> tuple:
+    written = []
+    monkeypatch.setattr(
+        cloud_logging.BackgroundLogger,
+        '_enqueue',
+        lambda self, method, payload, kwargs: written.append((method, payload, kwargs))
+    )
+    cloud_logger = MagicMock()
+    cloud_logger.name = 'repeating-log'
+    return cloud_logging.BackgroundLogger(cloud_logger), written
+
+
+def test_repeat_summary_is_written_once_the_window_closes(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(cloud_logging.time, 'monotonic', lambda: clock[0])
+    background, written = background_logger(monkeypatch)
+
+    for _ in range(3):
+        background.log_text('Connection refused', severity='ERROR')
+    background.flush_repeats()
+    assert written == [('log_text', 'Connection refused', {'severity': 'ERROR'})]
+
+    clock[0] += cloud_logging.DEDUP_WINDOW_SECONDS
+    background.flush_repeats()
+    assert written[1:] == [('log_text', 'Connection refused (repeated 2 more times)', {'severity': 'ERROR'})]
+
+    background.flush_repeats()
+    assert len(written) == 2
+
+
+def test_flush_writes_summaries_of_open_windows(monkeypatch):
+    background, written = background_logger(monkeypatch)
+
+    for _ in range(2):
+        background.log_struct({'message': 'timeout'}, severity='WARNING')
+    cloud_logging.flush()
+
+    assert written == [
+        ('log_struct', {'message': 'timeout'}, {'severity': 'WARNING'}),
+        ('log_struct', {'message': 'timeout', 'repeat_count': 1}, {'severity': 'WARNING'})
+    ]
+
+
+def test_entries_go_to_stderr_only_when_opted_in(monkeypatch):
+    stderr_entries = []
+    monkeypatch.setattr(cloud_logging, '_write_stderr', lambda entry, severity: stderr_entries.append(entry))
+    monkeypatch.setattr(cloud_logging, '_ensure_worker', lambda: None)
+    monkeypatch.setattr(cloud_logging, 'log_queue', cloud_logging.queue.Queue())
+    cloud_logger = MagicMock()
+    cloud_logger.name = 'routed-log'
+    background = cloud_logging.BackgroundLogger(cloud_logger)
+
+    monkeypatch.setattr(cloud_logging, 'LOG_TO_STDERR', False)
+    background.log_text('to the API', severity='INFO')
+    assert cloud_logging.log_queue.get_nowait() == (cloud_logger, 'log_text', 'to the API', {'severity': 'INFO'})
+    assert stderr_entries == []
+
+    monkeypatch.setattr(cloud_logging, 'LOG_TO_STDERR', True)
+    background.log_text('to stderr', severity='INFO')
+    assert cloud_logging.log_queue.empty()
+    assert len(stderr_entries) == 1
+
+
+def test_flush_gives_up_on_entries_that_cannot_be_written(monkeypatch, caplog):
+    stuck_queue = cloud_logging.queue.Queue()
+    stuck_queue.put('entry')
+    monkeypatch.setattr(cloud_logging, 'log_queue', stuck_queue)
+
+    started = cloud_logging.time.monotonic()
+    with caplog.at_level(logging.ERROR, logger=cloud_logging.__name__):
+        cloud_logging.flush(timeout=0.1)
+
+    assert cloud_logging.time.monotonic() - started < 1
+    assert '1 log entries' in caplog.records[-1].getMessage()
+
+
+def test_fork_replaces_dedup_locks_held_in_the_parent(monkeypatch):
+    background, written = background_logger(monkeypatch)
+    background.log_text('Connection refused')
+    background._recent_lock.acquire()
+
+    cloud_logging._reset_after_fork()
+
+    assert not background._recent_lock.locked()
+    background.log_text('Connection refused')
+    assert len(written) == 2
+
+
+def test_fork_drops_the_parents_pending_repeat_summaries(monkeypatch):
+    background, written = background_logger(monkeypatch)
+    for _ in range(3):
+        background.log_text('Connection refused')
+
+    cloud_logging._reset_after_fork()
+    assert not cloud_logging._repeating_loggers
+    cloud_logging.flush(timeout=0)
+
+    assert written == [('log_text', 'Connection refused', {})]
+
+
+def test_repeats_are_only_merged_under_the_same_labels(monkeypatch):
+    background, written = background_logger(monkeypatch)
+
+    background.log_struct({'message': 'Sync failed', 'id': 1}, labels={'account': 'a'})
+    background.log_struct({'message': 'Sync failed', 'id': 2}, labels={'account': 'b'})
+    background.log_struct({'message': 'Sync failed', 'id': 3}, labels={'account': 'a'})
+    background.log_struct({'id': 4})
+    background.log_struct({'id': 4})
+    cloud_logging.flush(timeout=0)
+
+    assert [(payload, kwargs['labels']) for _, payload, kwargs in written[:2]] == [
+        ({'message': 'Sync failed', 'id': 1}, {'account': 'a'}),
+        ({'message': 'Sync failed', 'id': 2}, {'account': 'b'})
+    ]
+    assert written[2:4] == [('log_struct', {'id': 4}, {}), ('log_struct', {'id': 4}, {})]
+    assert written[4:] == [
+        ('log_struct', {'message': 'Sync failed', 'id': 1, 'repeat_count': 1}, {'labels': {'account': 'a'}})
+    ]
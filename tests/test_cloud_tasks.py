@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from common.services import base, cloud_tasks
+
+
+def async_cloud_tasks_service(monkeypatch) -> tuple:
+    logged = []
+    monkeypatch.setattr(base, 'get_logging_client', MagicMock())
+    monkeypatch.setattr(base.BackgroundLogger, 'log_text', lambda self, text, **kwargs: logged.append(text))
+    in_flight = [0, 0]
+
+    async def create_task(request):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0)
+        in_flight[0] -= 1
+        return request['task']['http_request']['url']
+
+    client = SimpleNamespace(
+        queue_path=lambda project, location, queue: f"{project}/{location}/{queue}",
+        create_task=create_task
+    )
+    service = cloud_tasks.AsyncCloudTasksService(
+        cloud_tasks_client=client,
+        project='project',
+        location='location',
+        base_url='https://example.com',
+        service_account_email='tasks@example.com'
+    )
+    return service, logged, in_flight
+
+
+def test_async_enqueue_logs_the_awaited_result(monkeypatch):
+    service, logged, _ = async_cloud_tasks_service(monkeypatch)
+
+    assert asyncio.run(service.enqueue(queue='default', handler_uri='handle')) == 'https://example.com/handle'
+
+    assert len(logged) == 2
+    assert 'https://example.com/handle' in logged[1]
+    assert 'coroutine' not in logged[1]
+
+
+def test_enqueue_many_logs_once_and_bounds_concurrency(monkeypatch):
+    service, logged, in_flight = async_cloud_tasks_service(monkeypatch)
+    tasks = [{'queue': 'default', 'handler_uri': f"handle/{i}"} for i in range(cloud_tasks.ENQUEUE_MANY_CONCURRENCY * 3)]
+
+    urls = asyncio.run(service.enqueue_many(tasks))
+
+    assert urls == [f"https://example.com/handle/{i}" for i in range(len(tasks))]
+    assert len(logged) == 2
+    assert in_flight[1] == cloud_tasks.ENQUEUE_MANY_CONCURRENCY
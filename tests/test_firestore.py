@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from firedantic import Model
+
+from common.core.firestore import FIRESTORE_BATCH_MAX_WRITES, batched_writes, dump_document, set_document
+from common.models.aliases import CAMEL_CONFIG
+from common.models.firestore.installations import Installation, Output
+from common.models.firestore.prices import Price
+from common.models.firestore.products import Product
+from common.models.firestore.subscriptions import Subscription
+from common.models.firestore.users import User
+from common.models.monday.app_events import Subscription as MondaySubscription
+
+
+def test_batched_writes_commits_once_on_success():
+    client = MagicMock()
+    with batched_writes(client):
+        set_document(MagicMock(), {'name': 'a'})
+        set_document(MagicMock(), {'name': 'b'})
+
+    batch = client.batch.return_value
+    assert batch.set.call_count == 2
+    batch.commit.assert_called_once()
+
+
+def test_batched_writes_writes_nothing_when_block_fails():
+    client = MagicMock()
+    with pytest.raises(RuntimeError):
+        with batched_writes(client):
+            set_document(MagicMock(), {'name': 'a'})
+            raise RuntimeError
+
+    client.batch.return_value.commit.assert_not_called()
+
+
+def test_batched_writes_rejects_more_writes_than_one_batch_holds():
+    client = MagicMock()
+    with pytest.raises(ValueError):
+        with batched_writes(client):
+            for _ in range(FIRESTORE_BATCH_MAX_WRITES + 1):
+                set_document(MagicMock(), {})
+
+    client.batch.return_value.commit.assert_not_called()
+
+
+def test_set_document_writes_directly_outside_a_batch():
+    doc_ref = MagicMock()
+    set_document(doc_ref, {'name': 'a'})
+
+    doc_ref.set.assert_called_once_with({'name': 'a'})
+
+
+def assert_dumped_like_model_dump(model, **kwargs):
+    expected = model.model_dump(by_alias=True, exclude={model.__document_id__}, **kwargs)
+    assert dump_document(model, **kwargs) == expected
+
+
+@pytest.mark.parametrize('exclude_unset', [True, False])
+@pytest.mark.parametrize('exclude_none', [True, False])
+def test_dump_document_matches_model_dump(exclude_unset, exclude_none):
+    stripe_object = {'id': 'price_1', 'billing_scheme': 'per_unit', 'recurring': {'interval': 'month'}}
+    models = [
+        User(id='user-1', email='user@example.com', account_id=None),
+        Product(
+            id='product-1',
+            name='Sync',
+            stripe_object={'id': 'prod_1', 'metadata': {}},
+            prices=[Price(id='price-1', stripe_id='price_1', stripe_object=stripe_object), {'name': 'Annual'}]
+        ),
+        Subscription(
+            id='subscription-1',
+            active=True,
+            stripe_object={'id': 'sub_1', 'items': {'data': [{'price': stripe_object}]}},
+            monday_object=MondaySubscription(plan_id='basic', renewal_date=datetime(2024, 1, 1))
+        ),
+        Subscription(id='subscription-2', ended_at=None),
+        Installation(id='installation-1', final_output=[Output(name='a', url='b')], metadata={'step': 1})
+    ]
+    for model in models:
+        assert_dumped_like_model_dump(model, exclude_unset=exclude_unset, exclude_none=exclude_none)
+
+
+def test_dump_document_serializes_models_anywhere_in_untyped_containers():
+    class Document(Model):
+        __collection__ = 'documents'
+        items: Optional[List[Any]] = None
+        mapping: Optional[Dict[str, Any]] = None
+
+    document = Document(
+        items=[{'name': 'plain'}, Price(name='nested')],
+        mapping={'plain': 1, 'nested': Price(name='nested')}
+    )
+    assert_dumped_like_model_dump(document, exclude_unset=True)
+    assert dump_document(document)['items'][1] == {'name': 'nested'}
+
+
+def test_dump_document_uses_aliases_like_model_dump():
+    class AliasedDocument(Model):
+        __collection__ = 'aliased_documents'
+        display_name: Optional[str] = None
+        model_config = CAMEL_CONFIG
+
+    document = AliasedDocument(display_name='Sync')
+    assert dump_document(document) == {'displayName': 'Sync'}
+    assert_dumped_like_model_dump(document, exclude_unset=True)
+
+
+def test_dump_document_serializes_dataclass_values():
+    installation = Installation(final_output=[Output(name='a', url='b')])
+    assert dump_document(installation)['final_output'] == [{'name': 'a', 'url': 'b'}]
@@ -0,0 +1,72 @@
+import time
+import urllib.error
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jwt.algorithms import RSAAlgorithm
+
+from common.core import security
+
+AUDIENCE = 'https://service.example.com'
+
+
+@pytest.fixture
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def jwks_client(monkeypatch, signing_key):
+    client = jwt.PyJWKClient('https://www.googleapis.com/oauth2/v3/certs', cache_keys=True)
+    jwk = RSAAlgorithm.to_jwk(signing_key.public_key(), as_dict=True) | {'kid': 'google-key', 'alg': 'RS256'}
+    monkeypatch.setattr(client, 'fetch_data', lambda: {'keys': [jwk]})
+    monkeypatch.setattr(security, 'get_google_jwks_client', lambda: client)
+    monkeypatch.setattr(security, 'get_google_audience', lambda: AUDIENCE)
+    return client
+
+
+def google_claims(**overrides) -> dict:
+    return {
+        'iss': 'https://accounts.google.com',
+        'aud': AUDIENCE,
+        'exp': int(time.time()) + 300,
+        'sub': '1234'
+    } | overrides
+
+
+def test_verify_google_accepts_signed_google_token(jwks_client, signing_key):
+    token = jwt.encode(google_claims(), signing_key, algorithm='RS256', headers={'kid': 'google-key'})
+
+    security.verify_google(authorization=f"Bearer {token}")
+
+
+def test_verify_google_rejects_token_without_kid(jwks_client):
+    token = jwt.encode(google_claims(), 'forged-secret', algorithm='HS256')
+
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_google(authorization=f"Bearer {token}")
+    assert exc_info.value.status_code == 401
+
+
+def test_verify_google_rejects_malformed_token(jwks_client):
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_google(authorization='Bearer not-a-jwt')
+    assert exc_info.value.status_code == 401
+
+
+def test_verify_google_rejects_token_when_certs_cannot_be_fetched(monkeypatch, signing_key):
+    client = jwt.PyJWKClient('https://www.googleapis.com/oauth2/v3/certs')
+    monkeypatch.setattr(security, 'get_google_jwks_client', lambda: client)
+    monkeypatch.setattr(security, 'get_google_audience', lambda: AUDIENCE)
+
+    def unreachable(*args, **kwargs):
+        raise urllib.error.URLError('connection refused')
+
+    monkeypatch.setattr('urllib.request.urlopen', unreachable)
+    token = jwt.encode(google_claims(), signing_key, algorithm='RS256', headers={'kid': 'google-key'})
+
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_google(authorization=f"Bearer {token}")
+    assert exc_info.value.status_code == 401